@@ -13,12 +13,12 @@ import threading
 import queue
 import json
 from typing import Dict, List, Optional, Any
-import pytz
+from zoneinfo import ZoneInfo
 
 # Import ODTA components
 from src.orchestration.event_bus import EventBus
 from src.orchestration.events import (
-    Event, ScanRequest, DataUpdate, TradeSignal, 
+    Event, ScanRequest, DataUpdate, DataUpdateBatch, TradeSignal, 
     RiskAlert, SystemStatus, QuotaWarning, ErrorEvent,
     PersistenceEvent
 )
@@ -121,6 +121,11 @@ class DashboardEventHandler:
             }
         })
         
+    async def handle_data_update_batch(self, event: DataUpdateBatch):
+        """Handle a batch of updates published after a scan step"""
+        for update in event.updates:
+            await self.handle_data_update(update)
+        
     async def handle_quota_warning(self, event: QuotaWarning):
         """Handle quota warnings"""
         self.event_queue.put({
@@ -198,6 +203,7 @@ def run_event_loop(event_queue: queue.Queue):
             # Subscribe to events
             await event_bus.subscribe(TradeSignal, handler.handle_trade_signal)
             await event_bus.subscribe(DataUpdate, handler.handle_data_update)
+            await event_bus.subscribe(DataUpdateBatch, handler.handle_data_update_batch)
             await event_bus.subscribe(QuotaWarning, handler.handle_quota_warning)
             await event_bus.subscribe(RiskAlert, handler.handle_risk_alert)
             await event_bus.subscribe(SystemStatus, handler.handle_system_status)
@@ -350,7 +356,7 @@ with st.sidebar:
         overall = "🟢 Online" if all_online else "🟡 Partial" if any("🟢" in s for s in st.session_state.system_status.values()) else "🔴 Offline"
         st.metric("Overall", overall)
     with col2:
-        tz = pytz.timezone('Europe/Berlin')
+        tz = ZoneInfo('Europe/Berlin')
         current_time = datetime.now(tz).strftime("%H:%M")
         st.metric("Time (CET)", current_time)
     
@@ -26,6 +26,9 @@ class APIConfig:
     finnhub_calls_per_minute: int = 60
     alpha_vantage_daily_calls: int = 25
     news_api_daily_calls: int = 1000
+    
+    # Concurrency limit for news/sentiment requests during a scan
+    news_max_concurrent: int = 16
 
 @dataclass
 class TradingConfig:
@@ -139,7 +142,8 @@ def get_config() -> Config:
             news_api_key=os.getenv("NEWS_API_KEY", ""),
             finnhub_calls_per_minute=int(os.getenv("FINNHUB_CALLS_PER_MINUTE", "60")),
             alpha_vantage_daily_calls=int(os.getenv("ALPHA_VANTAGE_DAILY_CALLS", "25")),
-            news_api_daily_calls=int(os.getenv("NEWS_API_DAILY_CALLS", "1000"))
+            news_api_daily_calls=int(os.getenv("NEWS_API_DAILY_CALLS", "1000")),
+            news_max_concurrent=int(os.getenv("NEWS_MAX_CONCURRENT", "16"))
         )
         
         trading_config = TradingConfig(
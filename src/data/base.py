@@ -17,7 +17,7 @@ class DataProvider(Enum):
     GDELT = "gdelt"
     NEWSAPI = "newsapi"
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     """Market quote data"""
     symbol: str
@@ -32,8 +32,25 @@ class Quote:
     low: Optional[float] = None
     prev_close: Optional[float] = None
     market_state: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary"""
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'price': self.price,
+            'bid': self.bid,
+            'ask': self.ask,
+            'volume': self.volume,
+            'provider': self.provider,
+            'is_delayed': self.is_delayed,
+            'high': self.high,
+            'low': self.low,
+            'prev_close': self.prev_close,
+            'market_state': self.market_state
+        }
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     """OHLCV bar data"""
     symbol: str
@@ -44,6 +61,19 @@ class Bar:
     close: float
     volume: int
     provider: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary"""
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+            'provider': self.provider
+        }
 
 @dataclass
 class SentimentScore:
@@ -7,17 +7,46 @@ import json
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import hashlib
 import asyncio
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # Optional C serializer; stdlib json is the fallback
+    orjson = None
+
 from ..config import get_config
 from ..utils import get_logger
 
 logger = get_logger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize objects that expose to_dict() (Quote, Bar, CacheEntry)"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON cache file, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any):
+    """Write a JSON cache file (indented for readability)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, default=_json_default)
+
+
 class CacheService:
     """Simple synchronous cache service for testing."""
     
@@ -184,8 +213,7 @@ class CacheStore:
         if cache_file.exists():
             try:
                 async with self._lock:
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
+                    cache_data = _read_json(cache_file)
                 
                 # Look for our key
                 if key in cache_data:
@@ -204,7 +232,63 @@ class CacheStore:
         
         logger.debug(f"Cache miss for {key}")
         return None
-    
+
+    async def mget(
+        self,
+        provider: str,
+        params_list: List[Dict[str, Any]],
+        date: Optional[datetime] = None
+    ) -> List[Optional[Any]]:
+        """
+        Retrieve several entries from cache in a single pass
+
+        Memory hits are served directly; all remaining keys are resolved
+        with one read of the provider's cache file instead of one per key.
+
+        Args:
+            provider: API provider name
+            params_list: Parameters for each lookup
+            date: Date to retrieve from (default: today)
+
+        Returns:
+            Cached data (or None) for each entry in params_list, in order
+        """
+        keys = [self._generate_key(provider, params) for params in params_list]
+        results: List[Optional[Any]] = [None] * len(keys)
+        pending = []
+
+        for i, key in enumerate(keys):
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                if not entry.is_expired:
+                    results[i] = entry.data
+                    continue
+                del self._memory_cache[key]
+            pending.append(i)
+
+        if not pending:
+            return results
+
+        cache_file = self._get_cache_path(provider, date)
+        if cache_file.exists():
+            try:
+                async with self._lock:
+                    cache_data = _read_json(cache_file)
+
+                for i in pending:
+                    entry_data = cache_data.get(keys[i])
+                    if entry_data is None:
+                        continue
+                    entry = CacheEntry.from_dict(entry_data)
+                    if not entry.is_expired:
+                        self._memory_cache[keys[i]] = entry
+                        results[i] = entry.data
+
+            except Exception as e:
+                logger.error(f"Failed to read cache file {cache_file}: {e}")
+
+        return results
+
     async def set(
         self,
         provider: str,
@@ -245,21 +329,69 @@ class CacheStore:
                 # Read existing cache
                 cache_data = {}
                 if cache_file.exists():
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
+                    cache_data = _read_json(cache_file)
                 
                 # Add our entry
                 cache_data[key] = entry.to_dict()
                 
                 # Write back
-                with open(cache_file, 'w') as f:
-                    json.dump(cache_data, f, indent=2)
+                _write_json(cache_file, cache_data)
                 
                 logger.debug(f"Cached {key} with TTL {ttl}s")
             
             except Exception as e:
                 logger.error(f"Failed to write cache file {cache_file}: {e}")
     
+    async def delete(
+        self,
+        provider: str,
+        params: Dict[str, Any],
+        date: Optional[datetime] = None
+    ):
+        """
+        Remove a single entry from cache
+        
+        Args:
+            provider: API provider name
+            params: Parameters used for the API call
+            date: Date to remove from (default: today)
+        """
+        await self.delete_many(provider, [params], date)
+    
+    async def delete_many(
+        self,
+        provider: str,
+        params_list: List[Dict[str, Any]],
+        date: Optional[datetime] = None
+    ):
+        """
+        Remove several entries from one provider's cache with a single file rewrite
+        
+        Args:
+            provider: API provider name
+            params_list: Parameters of each API call to remove
+            date: Date to remove from (default: today)
+        """
+        keys = [self._generate_key(provider, params) for params in params_list]
+        for key in keys:
+            self._memory_cache.pop(key, None)
+        
+        cache_file = self._get_cache_path(provider, date)
+        if not cache_file.exists():
+            return
+        
+        async with self._lock:
+            try:
+                cache_data = _read_json(cache_file)
+                
+                removed = [key for key in keys if cache_data.pop(key, None) is not None]
+                if removed:
+                    _write_json(cache_file, cache_data)
+                    logger.debug(f"Deleted {len(removed)} entries from cache")
+            
+            except Exception as e:
+                logger.error(f"Failed to update cache file {cache_file}: {e}")
+    
     async def clear(self, provider: Optional[str] = None, date: Optional[datetime] = None):
         """
         Clear cache entries
@@ -306,8 +438,7 @@ class CacheStore:
         # Scan all cache files
         for cache_file in self.cache_dir.rglob("*.json"):
             try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
+                cache_data = _read_json(cache_file)
                 
                 for key, entry_data in cache_data.items():
                     total_entries += 1
@@ -339,8 +470,7 @@ class CacheStore:
         for cache_file in self.cache_dir.rglob("*.json"):
             try:
                 async with self._lock:
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
+                    cache_data = _read_json(cache_file)
                     
                     # Filter out expired entries
                     active_data = {}
@@ -354,8 +484,7 @@ class CacheStore:
                     # Write back if changed
                     if len(active_data) < len(cache_data):
                         if active_data:
-                            with open(cache_file, 'w') as f:
-                                json.dump(active_data, f, indent=2)
+                            _write_json(cache_file, active_data)
                         else:
                             # Remove empty file
                             cache_file.unlink()
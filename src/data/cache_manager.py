@@ -32,51 +32,49 @@ class CacheManager:
         data = await self.store.get('market', params)
         
         if data:
-            try:
-                # Reconstruct Quote object
-                return Quote(
-                    symbol=data['symbol'],
-                    timestamp=datetime.fromisoformat(data['timestamp']),
-                    price=data['price'],
-                    bid=data.get('bid'),
-                    ask=data.get('ask'),
-                    volume=data.get('volume'),
-                    provider=data.get('provider'),
-                    is_delayed=data.get('is_delayed', False)
-                )
-            except Exception as e:
-                logger.error(f"Failed to deserialize quote: {e}")
-                return None
+            return self._deserialize_quote(data)
                 
         return None
         
+    def _deserialize_quote(self, data: Dict) -> Optional[Quote]:
+        """Reconstruct a Quote object from its cached dict"""
+        try:
+            return Quote(
+                symbol=data['symbol'],
+                timestamp=datetime.fromisoformat(data['timestamp']),
+                price=data['price'],
+                bid=data.get('bid'),
+                ask=data.get('ask'),
+                volume=data.get('volume'),
+                provider=data.get('provider'),
+                is_delayed=data.get('is_delayed', False),
+                high=data.get('high'),
+                low=data.get('low'),
+                prev_close=data.get('prev_close'),
+                market_state=data.get('market_state')
+            )
+        except Exception as e:
+            logger.error(f"Failed to deserialize quote: {e}")
+            return None
+        
     async def put_quote(self, quote: Quote):
         """Cache a quote"""
         params = {'type': 'quote', 'symbol': quote.symbol}
-        
-        # Serialize Quote to dict
-        data = {
-            'symbol': quote.symbol,
-            'timestamp': quote.timestamp.isoformat(),
-            'price': quote.price,
-            'bid': quote.bid,
-            'ask': quote.ask,
-            'volume': quote.volume,
-            'provider': quote.provider,
-            'is_delayed': quote.is_delayed
-        }
-        
-        await self.store.set('market', params, data, self.quote_ttl)
+        await self.store.set('market', params, quote.to_dict(), self.quote_ttl)
         
     async def get_quotes(self, symbols: List[str]) -> Dict[str, Optional[Quote]]:
         """Get cached quotes for multiple symbols"""
-        results = {}
+        return await self.get_quotes_bulk(symbols)
         
-        for symbol in symbols:
-            quote = await self.get_quote(symbol)
-            results[symbol] = quote
-            
-        return results
+    async def get_quotes_bulk(self, symbols: List[str]) -> Dict[str, Optional[Quote]]:
+        """Get cached quotes for multiple symbols with a single store lookup"""
+        params_list = [{'type': 'quote', 'symbol': symbol} for symbol in symbols]
+        cached = await self.store.mget('market', params_list)
+        
+        return {
+            symbol: self._deserialize_quote(data) if data else None
+            for symbol, data in zip(symbols, cached)
+        }
         
     async def get_bars(
         self,
@@ -134,20 +132,7 @@ class CacheManager:
             'interval': interval
         }
         
-        # Serialize bars to list of dicts
-        data = []
-        for bar in bars:
-            data.append({
-                'symbol': bar.symbol,
-                'timestamp': bar.timestamp.isoformat(),
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume,
-                'provider': bar.provider
-            })
-            
+        data = [bar.to_dict() for bar in bars]
         await self.store.set('market', params, data, self.bar_ttl)
         
     async def clear_quotes(self):
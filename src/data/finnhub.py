@@ -33,12 +33,22 @@ class FinnhubWebSocket(MarketDataAdapter):
         self._reconnect_delay = 5
         self._max_reconnect_delay = 60
         
+        # Set whenever the connection is down, so callers can await a drop
+        self.disconnected_event = asyncio.Event()
+        self.disconnected_event.set()
+        self._close_watcher: Optional[asyncio.Task] = None
+        
     async def connect(self):
         """Establish WebSocket connection to Finnhub"""
         try:
             logger.info("Connecting to Finnhub WebSocket...")
+            await self._drop_stale_websocket()
             self.websocket = await websockets.connect(self.ws_url)
             self.is_connected = True
+            self.disconnected_event.clear()
+            
+            # Detect server-side drops even when nobody is running listen()
+            self._close_watcher = asyncio.create_task(self._watch_close(self.websocket))
             self._reconnect_delay = 5  # Reset delay on successful connection
             logger.info("Successfully connected to Finnhub WebSocket")
             
@@ -48,17 +58,47 @@ class FinnhubWebSocket(MarketDataAdapter):
                 
         except Exception as e:
             logger.error(f"Failed to connect to Finnhub WebSocket: {e}")
-            self.is_connected = False
+            self._mark_disconnected()
             raise
             
     async def disconnect(self):
         """Close WebSocket connection"""
         if self.websocket:
             logger.info("Disconnecting from Finnhub WebSocket...")
+            self._cancel_close_watcher()
             await self.websocket.close()
             self.websocket = None
-            self.is_connected = False
+            self._mark_disconnected()
+            
+    async def _watch_close(self, websocket):
+        """Mark the connection down once the given socket closes"""
+        await websocket.wait_closed()
+        # A reconnect may already have replaced this socket
+        if self.websocket is websocket:
+            logger.warning("Finnhub WebSocket closed by the server")
+            self._mark_disconnected()
             
+    def _cancel_close_watcher(self):
+        """Stop watching the current socket"""
+        if self._close_watcher is not None:
+            self._close_watcher.cancel()
+            self._close_watcher = None
+            
+    async def _drop_stale_websocket(self):
+        """Close a socket left over from a dropped connection before reconnecting"""
+        self._cancel_close_watcher()
+        stale, self.websocket = self.websocket, None
+        if stale is not None:
+            try:
+                await stale.close()
+            except Exception as e:
+                logger.debug(f"Error closing stale Finnhub WebSocket: {e}")
+            
+    def _mark_disconnected(self):
+        """Record that the connection is down and wake anyone waiting on it"""
+        self.is_connected = False
+        self.disconnected_event.set()
+        
     async def health_check(self) -> bool:
         """Check if WebSocket connection is healthy"""
         if not self.websocket:
@@ -137,15 +177,19 @@ class FinnhubWebSocket(MarketDataAdapter):
                                         callback(quote)
                                     except Exception as e:
                                         logger.error(f"Error in quote callback: {e}")
+                
+                # Server closed the connection cleanly
+                self._mark_disconnected()
                                         
             except WebSocketException as e:
                 logger.warning(f"WebSocket error: {e}, reconnecting in {self._reconnect_delay}s...")
-                self.is_connected = False
+                self._mark_disconnected()
                 await asyncio.sleep(self._reconnect_delay)
                 self._reconnect_delay = min(self._reconnect_delay * 2, self._max_reconnect_delay)
                 
             except Exception as e:
                 logger.error(f"Unexpected error in WebSocket listener: {e}")
+                self._mark_disconnected()
                 await asyncio.sleep(self._reconnect_delay)
                 
     def _parse_trade(self, trade: Dict[str, Any]) -> Optional[Quote]:
@@ -4,9 +4,10 @@ This module manages the trading universe, loading symbols from CSV,
 validating tradability, and filtering based on liquidity criteria.
 """
 
-import asyncio
 import csv
+import sys
 from pathlib import Path
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, timedelta
 
@@ -18,6 +19,16 @@ from src.data.cache_manager import CacheManager
 logger = setup_logger(__name__)
 
 
+@dataclass(slots=True)
+class ValidationEntry:
+    """Validation data recorded for a symbol that passed all criteria."""
+    price: float
+    volume: int
+    adv: float
+    market_cap: float
+    validated_at: datetime
+
+
 class UniverseManager:
     """Manages the trading universe for ODTA."""
     
@@ -55,7 +66,7 @@ class UniverseManager:
         
         # Internal state
         self._universe: Set[str] = set()
-        self._validated: Dict[str, Dict[str, Any]] = {}
+        self._validated: Dict[str, ValidationEntry] = {}
         
     async def load_universe(self) -> List[str]:
         """Load universe from CSV file.
@@ -96,7 +107,8 @@ class UniverseManager:
                 for row in reader:
                     symbol = row['symbol'].strip().upper()
                     if symbol and not symbol.startswith('#'):  # Skip comments
-                        symbols.append(symbol)
+                        # Intern so daily reloads share one string per ticker
+                        symbols.append(sys.intern(symbol))
                         
             logger.info(f"Loaded {len(symbols)} symbols from {self.universe_file}")
             self._universe = set(symbols)
@@ -122,61 +134,111 @@ class UniverseManager:
         try:
             # Get current quote
             quote = await self.market_data.get_quote(symbol)
-            if not quote:
-                logger.debug(f"{symbol}: No quote data available")
-                return False
-                
-            # Handle both dict and Quote object
-            if hasattr(quote, 'price'):
-                price = quote.price
-                volume = quote.volume or 0
-            else:
-                price = quote.get('price', 0)
-                volume = quote.get('volume', 0)
+            return self._check_quote(symbol, quote)
             
-            # Price range check
-            if price < self.min_price or price > self.max_price:
-                logger.debug(f"{symbol}: Price ${price:.2f} outside range [${self.min_price}-${self.max_price}]")
-                return False
-                
-            # Volume check (approximate ADV)
-            adv = price * volume
-            if adv < self.min_adv:
-                logger.debug(f"{symbol}: ADV ${adv:,.0f} below minimum ${self.min_adv:,.0f}")
-                return False
-                
-            # Market cap check (if available)
-            if hasattr(quote, 'market_cap'):
-                market_cap = getattr(quote, 'market_cap', 0)
-            elif hasattr(quote, 'get'):
-                market_cap = quote.get('market_cap', 0)
-            else:
-                market_cap = 0
-            if market_cap > 0 and market_cap < self.min_market_cap:
-                logger.debug(f"{symbol}: Market cap ${market_cap:,.0f} below minimum")
-                return False
+        except Exception as e:
+            logger.error(f"Error validating {symbol}: {e}")
+            return False
+            
+    async def _validate_batch(self, symbols: List[str]) -> List[str]:
+        """Validate a batch of symbols with a single market data call.
+        
+        ``MarketDataManager.get_quotes`` already walks the WebSocket,
+        bulk-cache and provider tiers, so the batch is not pre-read here.
+        
+        Args:
+            symbols: Stock symbols to validate
+            
+        Returns:
+            Symbols from the batch that meet all criteria
+        """
+        now = datetime.now()  # One timestamp for the whole batch
+        try:
+            quotes = await self.market_data.get_quotes(symbols)
+        except Exception as e:
+            logger.error(f"Error fetching quotes for batch: {e}")
+            quotes = {}
                 
-            # PRIIPs compliance - basic check
-            # In production, this would check regulatory database
-            if not self._check_priips_compliance(symbol):
-                logger.debug(f"{symbol}: Failed PRIIPs compliance check")
-                return False
+        active = []
+        for symbol in symbols:
+            try:
+                if self._check_quote(symbol, quotes.get(symbol), now):
+                    active.append(symbol)
+            except Exception as e:
+                logger.error(f"Error validating {symbol}: {e}")
                 
-            # Store validation data
-            self._validated[symbol] = {
-                'price': price,
-                'volume': volume,
-                'adv': adv,
-                'market_cap': market_cap,
-                'validated_at': datetime.now()
-            }
+        return active
+        
+    def _check_quote(
+        self,
+        symbol: str,
+        quote: Any,
+        now: Optional[datetime] = None
+    ) -> bool:
+        """Check a quote against the universe criteria and record the result.
+        
+        Args:
+            symbol: Stock symbol the quote belongs to
+            quote: Quote object or dict, or None if unavailable
+            now: Validation timestamp shared by a batch (defaults to now)
             
-            return True
+        Returns:
+            True if the quote meets all criteria
+        """
+        if not quote:
+            logger.debug("%s: No quote data available", symbol)
+            return False
             
-        except Exception as e:
-            logger.error(f"Error validating {symbol}: {e}")
+        # Handle both dict and Quote object
+        if hasattr(quote, 'price'):
+            price = quote.price
+            volume = quote.volume or 0
+        else:
+            price = quote.get('price', 0)
+            volume = quote.get('volume', 0)
+        
+        # Price range check
+        if price < self.min_price or price > self.max_price:
+            logger.debug(
+                "%s: Price $%.2f outside range [$%s-$%s]",
+                symbol, price, self.min_price, self.max_price
+            )
+            return False
+            
+        # Volume check (approximate ADV)
+        adv = price * volume
+        if adv < self.min_adv:
+            logger.debug("%s: ADV $%.0f below minimum $%.0f", symbol, adv, self.min_adv)
             return False
             
+        # Market cap check (if available)
+        if hasattr(quote, 'market_cap'):
+            market_cap = getattr(quote, 'market_cap', 0)
+        elif hasattr(quote, 'get'):
+            market_cap = quote.get('market_cap', 0)
+        else:
+            market_cap = 0
+        if market_cap > 0 and market_cap < self.min_market_cap:
+            logger.debug("%s: Market cap $%.0f below minimum", symbol, market_cap)
+            return False
+            
+        # PRIIPs compliance - basic check
+        # In production, this would check regulatory database
+        if not self._check_priips_compliance(symbol):
+            logger.debug("%s: Failed PRIIPs compliance check", symbol)
+            return False
+            
+        # Store validation data
+        self._validated[symbol] = ValidationEntry(
+            price=price,
+            volume=volume,
+            adv=adv,
+            market_cap=market_cap,
+            validated_at=now or datetime.now()
+        )
+        
+        return True
+            
     async def get_active_symbols(self) -> List[str]:
         """Get list of active, validated symbols.
         
@@ -205,18 +267,16 @@ class UniverseManager:
         for i in range(0, len(symbols), batch_size):
             batch = symbols[i:i + batch_size]
             
-            # Validate batch concurrently
-            tasks = [self.validate_symbol(symbol) for symbol in batch]
-            results = await asyncio.gather(*tasks)
-            
-            # Collect valid symbols
-            for symbol, is_valid in zip(batch, results):
-                if is_valid:
-                    active_symbols.append(symbol)
+            # Validate the whole batch with one get_quotes call
+            active_symbols.extend(await self._validate_batch(batch))
                     
             # Progress update
             if (i + batch_size) % 100 == 0:
-                logger.info(f"Validated {min(i + batch_size, len(symbols))}/{len(symbols)} symbols")
+                logger.info(
+                    "Validated %d/%d symbols",
+                    min(i + batch_size, len(symbols)),
+                    len(symbols)
+                )
                 
         logger.info(f"Found {len(active_symbols)} active symbols out of {len(symbols)}")
         
@@ -234,7 +294,8 @@ class UniverseManager:
         Returns:
             Dictionary with validation data or None
         """
-        return self._validated.get(symbol)
+        entry = self._validated.get(symbol)
+        return asdict(entry) if entry else None
         
     def _check_priips_compliance(self, symbol: str) -> bool:
         """Check if symbol is PRIIPs compliant for EU retail trading.
@@ -274,10 +335,12 @@ class UniverseManager:
         Returns:
             Updated list of symbols
         """
-        # Clear cache
-        await self.cache.store.delete('universe', {'key': self.cache_key})
+        # Clear cache (both entries share one cache file, so rewrite it once)
         cache_key = f"universe:validated:{datetime.now().strftime('%Y%m%d')}"
-        await self.cache.store.delete('universe', {'key': cache_key})
+        await self.cache.store.delete_many(
+            'universe',
+            [{'key': self.cache_key}, {'key': cache_key}]
+        )
         
         # Clear internal state
         self._universe.clear()
@@ -18,10 +18,21 @@ from src.orchestration import EventBus, Scheduler, Coordinator
 
 logger = get_logger(__name__)
 
+def install_uvloop() -> bool:
+    """Use uvloop for the asyncio event loop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+    return True
+
 @click.group()
 def cli():
     """One-Day Trading Agent CLI"""
-    pass
+    install_uvloop()
 
 @cli.command()
 def status():
@@ -297,6 +308,7 @@ async def run_orchestration(auto_schedule=True):
 
 def run_scan_cli():
     """Entry point for direct scan execution"""
+    install_uvloop()
     asyncio.run(run_scan())
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from src.orchestration.events import (
     EventPriority,
     ScanRequest,
     DataUpdate,
+    DataUpdateBatch,
     TradeSignal,
     RiskAlert,
     SystemStatus,
@@ -23,6 +24,7 @@ __all__ = [
     "EventPriority",
     "ScanRequest",
     "DataUpdate",
+    "DataUpdateBatch",
     "TradeSignal",
     "RiskAlert",
     "SystemStatus",
@@ -1,7 +1,7 @@
 """Main coordinator for orchestrating the complete scan workflow."""
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import time
 
@@ -18,7 +18,7 @@ from src.domain.risk import RiskManager
 from src.orchestration.event_bus import EventBus
 from src.orchestration.events import (
     ScanRequest, TradeSignal, SystemStatus, ErrorEvent,
-    RiskAlert, DataUpdate, EventPriority
+    RiskAlert, DataUpdate, DataUpdateBatch, EventPriority
 )
 from src.persistence.journal import TradeJournal
 from src.persistence.metrics import PerformanceMetrics
@@ -95,6 +95,13 @@ class Coordinator:
         self._running = False
         self._current_scan: Optional[asyncio.Task] = None
         
+        # Bound concurrent news requests to respect provider quotas
+        self._news_semaphore = asyncio.Semaphore(self.config.api.news_max_concurrent)
+        
+        # Sentiment per symbol, reused across overlapping scans until it expires
+        self._sentiment_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._sentiment_ttl = self.config.system.cache_ttl_minutes * 60
+        
     async def start(self):
         """Start the coordinator."""
         if self._running:
@@ -249,12 +256,22 @@ class Coordinator:
             # Step 3: Score candidates
             logger.info("Scoring candidates...")
             scored_candidates = []
+            updates = []
+            
+            # Fetch news sentiment for all gaps concurrently, once per symbol
+            symbols = list(dict.fromkeys(g.symbol for g in gaps))
+            fetched = await asyncio.gather(
+                *(self._get_news_sentiment(symbol) for symbol in symbols),
+                return_exceptions=True
+            )
+            sentiment_by_symbol = dict(zip(symbols, fetched))
             
             for gap_result in gaps:
+                news_sentiment = sentiment_by_symbol[gap_result.symbol]
                 try:
-                    # Get news sentiment
-                    news_sentiment = await self._get_news_sentiment(gap_result.symbol)
-                    
+                    if isinstance(news_sentiment, Exception):
+                        raise news_sentiment
+                        
                     # Score the candidate
                     score = self.factor_model.score_candidate(
                         gap_result,
@@ -263,8 +280,7 @@ class Coordinator:
                     
                     scored_candidates.append((gap_result, score))
                     
-                    # Emit data update
-                    await self.event_bus.publish(DataUpdate(
+                    updates.append(DataUpdate(
                         symbol=gap_result.symbol,
                         data_type="score",
                         update_data={
@@ -277,6 +293,10 @@ class Coordinator:
                     logger.error(f"Error scoring {gap_result.symbol}: {e}")
                     errors.append(f"Scoring error for {gap_result.symbol}: {str(e)}")
                     
+            # Emit data updates as one event
+            if updates:
+                await self.event_bus.publish(DataUpdateBatch(updates=updates))
+            
             result.candidates_scored = len(scored_candidates)
             
             # Step 4: Select top candidates
@@ -311,6 +331,7 @@ class Coordinator:
             # Step 6: Risk validation
             logger.info("Validating trades with risk manager...")
             approved_trades = []
+            score_by_symbol = {g.symbol: s for g, s in top_candidates}
             
             for trade_plan in trade_plans:
                 try:
@@ -323,16 +344,11 @@ class Coordinator:
                         approved_trades.append(trade_plan)
                         
                         # Emit trade signal
+                        score = score_by_symbol[trade_plan.symbol]
                         await self.event_bus.publish(TradeSignal(
                             trade_plan=trade_plan,
-                            score=next(
-                                s.total_score for g, s in top_candidates
-                                if g.symbol == trade_plan.symbol
-                            ),
-                            factors=next(
-                                s.factor_scores for g, s in top_candidates
-                                if g.symbol == trade_plan.symbol
-                            )
+                            score=score.total_score,
+                            factors=score.factor_scores
                         ))
                     else:
                         # Emit risk alert
@@ -402,8 +418,14 @@ class Coordinator:
         Returns:
             News sentiment data
         """
+        cached = self._sentiment_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self._sentiment_ttl:
+            return cached[1]
+            
         try:
-            news_data = await self.news_manager.get_sentiment(symbol)
+            async with self._news_semaphore:
+                news_data = await self.news_manager.get_sentiment(symbol)
+            self._sentiment_cache[symbol] = (time.monotonic(), news_data)
             return news_data
         except Exception as e:
             logger.error(f"Error getting news sentiment for {symbol}: {e}")
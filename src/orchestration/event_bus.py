@@ -1,7 +1,16 @@
-"""Async event bus for component communication."""
+"""Async event bus for component communication.
+
+The bus only relies on standard asyncio primitives, so it runs unchanged on
+uvloop. The CLI entry point installs the uvloop policy when the package is
+available (``pip install .[perf]``) and falls back to the default loop.
+"""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import time
 from collections import defaultdict
-from typing import Callable, Type, List, Dict, Any, Optional
+from typing import Callable, Type, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import traceback
@@ -20,28 +29,58 @@ class Subscription:
     handler: Callable[[Event], Any]
     filter_fn: Optional[Callable[[Event], bool]] = None
     name: Optional[str] = None
+    is_coro: bool = False  # Resolved once at subscribe time
 
 
 class EventBus:
     """Asynchronous event bus for component communication."""
     
-    def __init__(self, max_queue_size: int = 1000):
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        error_coalesce_window: float = 1.0,
+        handler_workers: int = 4
+    ):
         """Initialize event bus.
         
+        Sync handlers run on a small executor owned by the bus rather than the
+        loop's default one, so they must not block for long.
+        
         Args:
             max_queue_size: Maximum number of events in queue
+            error_coalesce_window: Seconds during which repeated failures of
+                the same handler with the same exception type publish only
+                one ErrorEvent
+            handler_workers: Threads available to sync handlers
         """
         self.max_queue_size = max_queue_size
+        self.error_coalesce_window = error_coalesce_window
+        self._last_handler_error: Dict[Tuple[str, str], float] = {}
         self._subscribers: Dict[Type[Event], List[Subscription]] = defaultdict(list)
-        self._event_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
+        # Per event type: specific subscribers followed by base Event ones.
+        # Filled lazily on dispatch, cleared whenever subscriptions change.
+        # Keyed by class: type objects hash by identity, so this costs the same
+        # as indexing a list by a per-class integer id and needs no registry.
+        self._dispatch_cache: Dict[Type[Event], Tuple[Subscription, ...]] = {}
+        
+        # Single-consumer priority queue: a heap of (priority, seq, event)
+        # plus an "items available" flag for the worker to wait on
+        self._heap: List[tuple] = []
+        self._available = asyncio.Event()
+        self._drained = asyncio.Event()  # Set once every queued event is handled
+        self._drained.set()
         self._running = False
         self._worker_task: Optional[asyncio.Task] = None
-        self._event_counter = 0
+        self.handler_workers = handler_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._next_seq = itertools.count().__next__  # FIFO tie-breaker within a priority
         self._metrics = {
             "events_published": 0,
             "events_processed": 0,
             "events_failed": 0,
-            "events_dropped": 0
+            "events_dropped": 0,
+            "errors_coalesced": 0,
+            "events_no_subscribers": 0
         }
         
     async def start(self):
@@ -51,16 +90,23 @@ class EventBus:
             return
             
         self._running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.handler_workers,
+            thread_name_prefix="evbus"
+        )
         self._worker_task = asyncio.create_task(self._process_events())
         logger.info("Event bus started")
         
     async def stop(self):
         """Stop the event bus gracefully."""
         self._running = False
+        self._available.set()  # Wake the worker so it can drain and exit
         
-        # Process remaining events
-        while not self._event_queue.empty():
-            await asyncio.sleep(0.1)
+        # Let the worker finish the remaining events
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning(f"Event bus stopped with {len(self._heap)} events undelivered")
             
         if self._worker_task:
             self._worker_task.cancel()
@@ -69,11 +115,19 @@ class EventBus:
             except asyncio.CancelledError:
                 pass
                 
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            
         logger.info(f"Event bus stopped. Metrics: {self._metrics}")
         
     async def publish(self, event: Event, priority: Optional[EventPriority] = None):
         """Publish an event to the bus.
         
+        When the queue is full, CRITICAL events are still accepted, HIGH events
+        displace the newest queued NORMAL/LOW event, and anything else is
+        dropped.
+        
         Args:
             event: Event to publish
             priority: Override event priority
@@ -82,22 +136,66 @@ class EventBus:
             logger.error("Cannot publish event - bus not running")
             return
             
+        # Nobody would receive it, so skip the queue entirely
+        if not self._subscribers_for(type(event)):
+            self._metrics["events_no_subscribers"] += 1
+            return
+            
         if priority:
             event.priority = priority
             
         # Use negative priority for proper ordering (higher priority = lower number)
         priority_value = -event.priority.value
-        self._event_counter += 1
+        heap = self._heap
         
-        try:
-            # Non-blocking put
-            self._event_queue.put_nowait((priority_value, self._event_counter, event))
-            self._metrics["events_published"] += 1
-            logger.debug(f"Published event: {event.event_type.value} with priority {event.priority.name}")
-        except asyncio.QueueFull:
+        if len(heap) >= self.max_queue_size and not self._make_room(event):
             self._metrics["events_dropped"] += 1
             logger.error(f"Event queue full, dropping event: {event.event_type.value}")
+            return
+            
+        heapq.heappush(heap, (priority_value, self._next_seq(), event))
+        self._drained.clear()
+        self._available.set()
+        self._metrics["events_published"] += 1
+        logger.debug(
+            f"Published event: {event.event_type.value} with priority {event.priority.name}"
+        )
             
+    def _make_room(self, event: Event) -> bool:
+        """Decide whether an event may enter a full queue.
+        
+        CRITICAL events are admitted over capacity rather than awaited, since
+        they are often published from inside a handler that the worker is
+        itself waiting on. HIGH events evict the newest lower-priority entry.
+        
+        Args:
+            event: Event being published
+            
+        Returns:
+            True if the event should be queued
+        """
+        if event.priority is EventPriority.CRITICAL:
+            return True
+            
+        if event.priority is not EventPriority.HIGH:
+            return False
+            
+        heap = self._heap
+        victim = max(range(len(heap)), key=lambda i: heap[i][:2])
+        if -heap[victim][0] >= EventPriority.HIGH.value:
+            return False
+            
+        evicted = heap[victim][2]
+        heap[victim] = heap[-1]
+        heap.pop()
+        heapq.heapify(heap)
+        
+        self._metrics["events_dropped"] += 1
+        logger.warning(
+            f"Event queue full, evicted {evicted.event_type.value} for {event.event_type.value}"
+        )
+        return True
+        
     async def subscribe(
         self,
         event_type: Type[Event],
@@ -117,10 +215,12 @@ class EventBus:
             event_type=event_type,
             handler=handler,
             filter_fn=filter_fn,
-            name=name or handler.__name__
+            name=name or handler.__name__,
+            is_coro=asyncio.iscoroutinefunction(handler)
         )
         
         self._subscribers[event_type].append(subscription)
+        self._dispatch_cache.clear()
         logger.info(f"Subscribed {subscription.name} to {event_type.__name__}")
         
     async def unsubscribe(self, event_type: Type[Event], handler: Callable[[Event], Any]):
@@ -134,63 +234,95 @@ class EventBus:
             sub for sub in self._subscribers[event_type]
             if sub.handler != handler
         ]
+        self._dispatch_cache.clear()
         
     async def _process_events(self):
         """Process events from the queue."""
         logger.info("Event processor started")
         
-        while self._running:
-            try:
-                # Wait for event with timeout
-                priority, counter, event = await asyncio.wait_for(
-                    self._event_queue.get(),
-                    timeout=1.0
-                )
+        # Keep draining after stop() until the heap is empty
+        while self._running or self._heap:
+            if not self._heap:
+                self._drained.set()
+                self._available.clear()
+                await self._available.wait()
+                continue
                 
-                # Process event
+            priority, counter, event = heapq.heappop(self._heap)
+            
+            try:
                 await self._dispatch_event(event)
                 self._metrics["events_processed"] += 1
                 
-            except asyncio.TimeoutError:
-                # No events, continue
-                continue
             except Exception as e:
                 logger.error(f"Error processing event: {e}")
                 self._metrics["events_failed"] += 1
                 
+        self._drained.set()
+                
     async def _dispatch_event(self, event: Event):
         """Dispatch event to all subscribers.
         
         Args:
             event: Event to dispatch
         """
-        # Get subscribers for exact event type
-        subscribers = self._subscribers.get(type(event), [])
-        
-        # Also get subscribers for base Event class
-        if type(event) != Event:
-            subscribers.extend(self._subscribers.get(Event, []))
+        subscribers = self._subscribers_for(type(event))
             
         if not subscribers:
             logger.debug(f"No subscribers for event: {event.event_type.value}")
             return
             
-        # Create tasks for all handlers
-        tasks = []
-        for subscription in subscribers:
-            # Apply filter if present
-            if subscription.filter_fn and not subscription.filter_fn(event):
-                continue
-                
-            task = asyncio.create_task(
-                self._safe_handler_call(subscription, event)
-            )
-            tasks.append(task)
+        # Apply filters up front
+        filtered = [
+            s for s in subscribers
+            if not s.filter_fn or s.filter_fn(event)
+        ]
+        if not filtered:
+            return
+            
+        # Fast path: a single handler is awaited inline, no task needed
+        if len(filtered) == 1:
+            await self._safe_handler_call(filtered[0], event)
+            return
             
         # Wait for all handlers to complete
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(
+            *(self._safe_handler_call(s, event) for s in filtered),
+            return_exceptions=True
+        )
+            
+    def _subscribers_for(self, event_cls: Type[Event]) -> Tuple[Subscription, ...]:
+        """Get the cached dispatch list for an event type.
+        
+        Args:
+            event_cls: Concrete event type being dispatched
             
+        Returns:
+            Subscribers that receive events of this type
+        """
+        subscribers = self._dispatch_cache.get(event_cls)
+        if subscribers is None:
+            subscribers = self._resolve_subscribers(event_cls)
+        return subscribers
+        
+    def _resolve_subscribers(self, event_cls: Type[Event]) -> Tuple[Subscription, ...]:
+        """Build and cache the dispatch list for an event type.
+        
+        Args:
+            event_cls: Concrete event type being dispatched
+            
+        Returns:
+            Subscribers for the exact type followed by base Event subscribers
+        """
+        subscribers = tuple(self._subscribers.get(event_cls, ()))
+        
+        # Also include subscribers for base Event class
+        if event_cls is not Event:
+            subscribers += tuple(self._subscribers.get(Event, ()))
+            
+        self._dispatch_cache[event_cls] = subscribers
+        return subscribers
+        
     async def _safe_handler_call(self, subscription: Subscription, event: Event):
         """Safely call event handler with error isolation.
         
@@ -199,13 +331,12 @@ class EventBus:
             event: Event to handle
         """
         try:
-            # Check if handler is async
-            if asyncio.iscoroutinefunction(subscription.handler):
+            if subscription.is_coro:
                 await subscription.handler(event)
             else:
-                # Run sync handler in thread pool
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
+                # Run sync handler in the bus's thread pool
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
                     subscription.handler,
                     event
                 )
@@ -214,15 +345,28 @@ class EventBus:
             logger.error(f"Handler {subscription.name} failed for event {event.event_type.value}: {e}")
             
             # Publish error event (avoid infinite loop)
-            if not isinstance(event, ErrorEvent):
-                error_event = ErrorEvent(
-                    error_type="handler_error",
-                    error_message=str(e),
-                    component=subscription.name,
-                    traceback=traceback.format_exc(),
-                    recoverable=True
-                )
-                await self.publish(error_event)
+            if isinstance(event, ErrorEvent):
+                return
+                
+            # Coalesce error storms from the same handler and exception type
+            key = (subscription.name, type(e).__name__)
+            now = time.monotonic()
+            last = self._last_handler_error.get(key)
+            if last is not None and now - last < self.error_coalesce_window:
+                self._metrics["errors_coalesced"] += 1
+                return
+            self._last_handler_error[key] = now
+            
+            # Only pay for formatting the traceback if someone will read it
+            subscribers = self._subscribers_for(ErrorEvent)
+            error_event = ErrorEvent(
+                error_type="handler_error",
+                error_message=str(e),
+                component=subscription.name,
+                traceback=traceback.format_exc() if subscribers else None,
+                recoverable=True
+            )
+            await self.publish(error_event)
                 
     def get_metrics(self) -> Dict[str, Any]:
         """Get event bus metrics.
@@ -232,7 +376,7 @@ class EventBus:
         """
         return {
             **self._metrics,
-            "queue_size": self._event_queue.qsize(),
+            "queue_size": len(self._heap),
             "subscriber_count": sum(len(subs) for subs in self._subscribers.values())
         }
         
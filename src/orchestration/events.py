@@ -1,6 +1,7 @@
 """Event definitions for the orchestration layer."""
 from dataclasses import dataclass, field
 from datetime import datetime
+import time
 from enum import Enum
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
@@ -27,21 +28,27 @@ class EventType(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base event class."""
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)  # latency and ordering
+    wall_ns: int = field(default_factory=time.time_ns)  # wall-clock creation time
     priority: EventPriority = field(default=EventPriority.NORMAL)
     source: str = field(default="system")
     data: Dict[str, Any] = field(default_factory=dict)
     
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock creation time, derived from ``wall_ns`` on access."""
+        return datetime.fromtimestamp(self.wall_ns / 1e9)
+    
     @property
     def event_type(self) -> EventType:
         """Get event type - must be overridden by subclasses."""
         return EventType.SYSTEM_STATUS
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanRequest(Event):
     """Request to run a market scan."""
     scan_type: str = ""  # "primary" or "second_look"
@@ -53,7 +60,7 @@ class ScanRequest(Event):
         return EventType.SCAN_REQUEST
 
 
-@dataclass
+@dataclass(slots=True)
 class DataUpdate(Event):
     """Market data update event."""
     symbol: str = ""
@@ -65,7 +72,17 @@ class DataUpdate(Event):
         return EventType.DATA_UPDATE
 
 
-@dataclass
+@dataclass(slots=True)
+class DataUpdateBatch(Event):
+    """Several data updates delivered as a single event."""
+    updates: List[DataUpdate] = field(default_factory=list)
+    
+    @property
+    def event_type(self) -> EventType:
+        return EventType.DATA_UPDATE
+
+
+@dataclass(slots=True)
 class TradeSignal(Event):
     """Trading signal event."""
     trade_plan: Any = None  # TradePlan instance
@@ -78,7 +95,7 @@ class TradeSignal(Event):
         return EventType.TRADE_SIGNAL
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAlert(Event):
     """Risk management alert."""
     alert_type: str = ""  # "position_limit", "loss_limit", "correlation", "priips"
@@ -98,7 +115,7 @@ class RiskAlert(Event):
         return EventType.RISK_ALERT
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemStatus(Event):
     """System status update."""
     component: str = ""
@@ -111,7 +128,7 @@ class SystemStatus(Event):
         return EventType.SYSTEM_STATUS
 
 
-@dataclass
+@dataclass(slots=True)
 class QuotaWarning(Event):
     """API quota warning event."""
     provider: str = ""
@@ -131,7 +148,7 @@ class QuotaWarning(Event):
         return EventType.QUOTA_WARNING
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent(Event):
     """Error event for system errors."""
     error_type: str = ""
@@ -152,7 +169,7 @@ class ErrorEvent(Event):
         return EventType.ERROR
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistenceEvent(Event):
     """Event for persistence operations."""
     priority: EventPriority = EventPriority.NORMAL
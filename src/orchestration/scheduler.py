@@ -1,22 +1,84 @@
 """Scheduler for automated market scans."""
 import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import random
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from time import monotonic, time as epoch_now
+from typing import Dict, List, Optional, Callable, Any, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
-import pytz
+from zoneinfo import ZoneInfo
+
+try:
+    import orjson
+except ImportError:  # Optional C serializer; stdlib json is the fallback
+    orjson = None
 
 from src.utils.logger import get_logger
 from src.orchestration.event_bus import EventBus
 from src.orchestration.events import (
-    ScanRequest, SystemStatus, ErrorEvent, EventPriority
+    ScanRequest, SystemStatus, ErrorEvent
 )
-from src.data.finnhub import FinnhubWebSocket
 from src.config.settings import get_config
 
+if TYPE_CHECKING:
+    from src.data.finnhub import FinnhubWebSocket
+
 
 logger = get_logger(__name__)
 
+# Upper bound on a single scheduler sleep, in seconds
+MAX_SCHEDULER_SLEEP = 300.0
+
+# A WebSocket connection must stay up this long to reset the backoff, in seconds
+STABLE_CONNECTION_SECONDS = 30.0
+
+# Minimum spacing between scheduler loop ErrorEvents during an outage, in seconds
+ERROR_PUBLISH_INTERVAL = 300.0
+
+# Saves requested within this window are written together, in seconds
+STATE_SAVE_DEBOUNCE = 0.5
+
+
+def _read_state_file(path: str) -> Dict[str, Any]:
+    """Read the scheduler state file, using orjson when available."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_state_file(path: str, state: Dict[str, Any]):
+    """Atomically replace the scheduler state file and fsync it."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    
+    # Encode straight to bytes so the write needs no str -> utf-8 pass
+    if orjson is not None:
+        data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(state, indent=2).encode("utf-8")
+        
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    
+    # Persist the rename itself (not supported on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 class ScanType(Enum):
     """Types of market scans."""
@@ -25,7 +87,10 @@ class ScanType(Enum):
     MANUAL = "manual"
 
 
-@dataclass
+_SCAN_TYPE_BY_VALUE = {t.value: t for t in ScanType}
+
+
+@dataclass(slots=True)
 class ScheduledScan:
     """Scheduled scan configuration."""
     scan_type: ScanType
@@ -33,6 +98,7 @@ class ScheduledScan:
     enabled: bool = True
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
+    deadline: Optional[float] = None  # next_run as epoch seconds, for cheap comparisons
 
 
 class Scheduler:
@@ -49,12 +115,15 @@ class Scheduler:
         self._running = False
         self._tasks: Dict[str, asyncio.Task] = {}
         
+        # Set to re-evaluate the schedule before the next deadline
+        self._wakeup = asyncio.Event()
+        
         # WebSocket connection
-        self._websocket: Optional[FinnhubWebSocket] = None
+        self._websocket: Optional['FinnhubWebSocket'] = None
         self._websocket_task: Optional[asyncio.Task] = None
         
         # Scheduled scans (in CET timezone)
-        self.cet = pytz.timezone('CET')
+        self.cet = ZoneInfo('Europe/Berlin')
         self.scheduled_scans = {
             ScanType.PRIMARY: ScheduledScan(
                 scan_type=ScanType.PRIMARY,
@@ -68,8 +137,21 @@ class Scheduler:
             )
         }
         
+        # Min-heap of (deadline, seq, scan type); entries whose deadline no
+        # longer matches the scan's current deadline are stale and skipped
+        self._deadlines: List[Tuple[float, int, ScanType]] = []
+        self._deadline_seq = itertools.count().__next__
+        
         # State for persistence
         self._state_file = "data/scheduler_state.json"
+        self._state_dirty = asyncio.Event()
+        self._state_lock = asyncio.Lock()
+        
+        # Monotonic time of the last loop ErrorEvent, for rate limiting
+        self._last_error_published: Optional[float] = None
+        
+        # Per-scan part of get_status(), rebuilt after schedule changes
+        self._scan_status_cache: Optional[Dict[str, Any]] = None
         
     async def start(self):
         """Start the scheduler."""
@@ -88,8 +170,9 @@ class Scheduler:
         # Start WebSocket connection
         await self._start_websocket()
         
-        # Start scheduler task
-        self._tasks["scheduler"] = asyncio.create_task(self._scheduler_loop())
+        # Start scheduler and state persistence tasks
+        self._spawn("scheduler", self._scheduler_loop())
+        self._spawn("persistence", self._persistence_loop())
         
         # Emit status event
         await self.event_bus.publish(SystemStatus(
@@ -106,23 +189,40 @@ class Scheduler:
         
     async def stop(self):
         """Stop the scheduler gracefully."""
+        # Never started: _load_state() has not run, so saving now would
+        # overwrite the persisted schedule with the defaults
+        if not self._running and not self._tasks:
+            return
+            
         self._running = False
+        self._wakeup.set()
         
-        # Save state
-        await self._save_state()
+        # Save state now rather than after the debounce; shielded so a
+        # cancelled stop() cannot abandon the write halfway
+        self._state_dirty.clear()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._write_state()), timeout=3.0)
+        except asyncio.TimeoutError:
+            logger.warning("Scheduler state save timed out during shutdown")
         
         # Stop WebSocket
         await self._stop_websocket()
         
-        # Cancel all tasks
-        for task_name, task in self._tasks.items():
-            if task and not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    logger.debug(f"Task {task_name} cancelled")
-                    
+        # Cancel all tasks at once and wait for them together, bounded so a
+        # task that ignores cancellation cannot hang shutdown
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+            
+        if pending:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*pending, return_exceptions=True),
+                    timeout=5.0
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Scheduler shutdown timed out; abandoning remaining tasks")
+                
         self._tasks.clear()
         
         # Emit status event
@@ -134,6 +234,29 @@ class Scheduler:
         
         logger.info("Scheduler stopped")
         
+    def _spawn(self, name: str, coro) -> asyncio.Task:
+        """Start a background task owned by the scheduler.
+        
+        The task is kept in ``_tasks`` so it cannot be garbage collected while
+        running, and is cancelled by ``stop()``.
+        
+        Args:
+            name: Key for the task in ``_tasks``
+            coro: Coroutine to run
+            
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro, name=f"scheduler-{name}")
+        task.add_done_callback(self._on_task_done)
+        self._tasks[name] = task
+        return task
+        
+    def _on_task_done(self, task: asyncio.Task):
+        """Surface background task crashes that would otherwise go unnoticed."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Scheduler task {task.get_name()} crashed: {task.exception()!r}")
+            
     async def trigger_manual_scan(self, scan_type: str = "manual") -> bool:
         """Trigger a manual scan.
         
@@ -149,16 +272,16 @@ class Scheduler:
                 scan_type=scan_type,
                 source="scheduler_manual"
             )
-            scan_request.priority = EventPriority.HIGH
             
             # Publish event
             await self.event_bus.publish(scan_request)
+            self._wakeup.set()
             
-            logger.info(f"Manual scan triggered: {scan_type}")
+            logger.info("Manual scan triggered: %s", scan_type)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to trigger manual scan: {e}")
+            logger.error("Failed to trigger manual scan: %s", e)
             await self.event_bus.publish(ErrorEvent(
                 error_type="scan_trigger_error",
                 error_message=str(e),
@@ -180,7 +303,9 @@ class Scheduler:
             new_time = time(hour, minute)
             
             # Update or create scheduled scan
-            scan_enum = ScanType(scan_type)
+            scan_enum = _SCAN_TYPE_BY_VALUE.get(scan_type)
+            if scan_enum is None:
+                raise ValueError(f"Unknown scan type: {scan_type}")
             if scan_enum in self.scheduled_scans:
                 self.scheduled_scans[scan_enum].scheduled_time = new_time
                 self.scheduled_scans[scan_enum].enabled = True
@@ -193,6 +318,7 @@ class Scheduler:
                 
             # Update next run
             self._update_next_runs()
+            self._wakeup.set()
             
             # Save state
             await self._save_state()
@@ -209,46 +335,80 @@ class Scheduler:
         
         while self._running:
             try:
-                # Check for scheduled scans
-                now = datetime.now(self.cet)
+                # Pop every due deadline from the heap root
+                now_ts = epoch_now()
+                now: Optional[datetime] = None
+                deadlines = self._deadlines
                 
-                for scan_type, scan_config in self.scheduled_scans.items():
-                    if not scan_config.enabled:
+                while deadlines and deadlines[0][0] <= now_ts:
+                    deadline, _, scan_type = heapq.heappop(deadlines)
+                    scan_config = self.scheduled_scans.get(scan_type)
+                    
+                    # Skip entries superseded by a reschedule or a disable
+                    if (scan_config is None or not scan_config.enabled
+                            or scan_config.deadline != deadline):
                         continue
                         
-                    if scan_config.next_run and now >= scan_config.next_run:
-                        # Time to run scan
-                        await self._execute_scheduled_scan(scan_config)
+                    # One clock reading per tick serves the status metrics,
+                    # last run and next run alike
+                    if now is None:
+                        now = datetime.fromtimestamp(now_ts, self.cet)
                         
-                        # Update last run and calculate next run
+                    # Time to run scan; the popped entry must be replaced even
+                    # if the run raises, or the scan would never fire again
+                    try:
+                        await self._execute_scheduled_scan(scan_config, now)
+                    finally:
+                        # Update last run and advance only this scan
                         scan_config.last_run = now
-                        self._update_next_runs()
-                        
-                        # Save state
-                        await self._save_state()
-                        
-                # Sleep for a short interval
-                await asyncio.sleep(30)  # Check every 30 seconds
+                        self._update_next_run_for(scan_config, now)
+                    
+                    # Save state
+                    await self._save_state()
+                    
+                # Sleep until the next deadline or until woken early
+                await self._wait_for_next_run()
                 
             except Exception as e:
-                logger.error(f"Scheduler loop error: {e}")
-                await self.event_bus.publish(ErrorEvent(
-                    error_type="scheduler_loop_error",
-                    error_message=str(e),
-                    component="scheduler",
-                    recoverable=True
-                ))
+                logger.error("Scheduler loop error: %s", e)
+                
+                # One ErrorEvent per interval is enough to flag a lasting outage
+                now_mono = monotonic()
+                if (self._last_error_published is None
+                        or now_mono - self._last_error_published >= ERROR_PUBLISH_INTERVAL):
+                    self._last_error_published = now_mono
+                    await self.event_bus.publish(ErrorEvent(
+                        error_type="scheduler_loop_error",
+                        error_message=str(e),
+                        component="scheduler",
+                        recoverable=True
+                    ))
                 
                 # Sleep before retry
                 await asyncio.sleep(60)
                 
-    async def _execute_scheduled_scan(self, scan_config: ScheduledScan):
+    async def _wait_for_next_run(self):
+        """Sleep until the earliest next run, a config change, or stop."""
+        # Re-check at least every few minutes to absorb clock adjustments.
+        # A stale heap root only causes an early, harmless wakeup.
+        delay = MAX_SCHEDULER_SLEEP
+        if self._deadlines:
+            delay = min(delay, max(0.0, self._deadlines[0][0] - epoch_now()))
+            
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+        
+    async def _execute_scheduled_scan(self, scan_config: ScheduledScan, now: datetime):
         """Execute a scheduled scan.
         
         Args:
             scan_config: Scan configuration
+            now: Current time in the scheduler timezone
         """
-        logger.info(f"Executing scheduled {scan_config.scan_type.value} scan")
+        logger.info("Executing scheduled %s scan", scan_config.scan_type.value)
         
         try:
             # Create scan request
@@ -256,25 +416,31 @@ class Scheduler:
                 scan_type=scan_config.scan_type.value,
                 source="scheduler_auto"
             )
-            scan_request.priority = EventPriority.HIGH
-            
-            # Publish event
-            await self.event_bus.publish(scan_request)
-            
-            # Emit status
-            await self.event_bus.publish(SystemStatus(
+            status = SystemStatus(
                 component="scheduler",
                 status="scan_triggered",
                 message=f"Triggered {scan_config.scan_type.value} scan",
                 metrics={
                     "scan_type": scan_config.scan_type.value,
                     "scheduled_time": scan_config.scheduled_time.isoformat(),
-                    "execution_time": datetime.now().isoformat()
+                    "execution_time": now.isoformat()
                 }
-            ))
+            )
+            
+            # Publish the request and its status together; a failed status
+            # publish is only telemetry and must not fail the scan
+            request_result, status_result = await asyncio.gather(
+                self.event_bus.publish(scan_request),
+                self.event_bus.publish(status),
+                return_exceptions=True
+            )
+            if isinstance(status_result, Exception):
+                logger.warning("Failed to publish scan status: %s", status_result)
+            if isinstance(request_result, Exception):
+                raise request_result
             
         except Exception as e:
-            logger.error(f"Failed to execute scheduled scan: {e}")
+            logger.error("Failed to execute scheduled scan: %s", e)
             await self.event_bus.publish(ErrorEvent(
                 error_type="scheduled_scan_error",
                 error_message=str(e),
@@ -286,59 +452,81 @@ class Scheduler:
         """Update next run times for all scheduled scans."""
         now = datetime.now(self.cet)
         
+        # Every scan gets a fresh entry, so drop the old ones outright
+        self._deadlines.clear()
         for scan_config in self.scheduled_scans.values():
-            if not scan_config.enabled:
-                scan_config.next_run = None
-                continue
-                
-            # Calculate next run time
-            next_run = now.replace(
-                hour=scan_config.scheduled_time.hour,
-                minute=scan_config.scheduled_time.minute,
-                second=0,
-                microsecond=0
-            )
+            self._update_next_run_for(scan_config, now)
             
-            # If time has passed today, schedule for tomorrow
-            if next_run <= now:
-                next_run += timedelta(days=1)
-                
-            scan_config.next_run = next_run
+    def _update_next_run_for(self, scan_config: ScheduledScan, now: datetime):
+        """Update the next run time of a single scheduled scan.
+        
+        Args:
+            scan_config: Scan configuration to update
+            now: Current time in the scheduler timezone
+        """
+        if not scan_config.enabled:
+            scan_config.next_run = None
+            scan_config.deadline = None
+            self._scan_status_cache = None
+            return
             
-        # Log next runs
-        for scan_type, scan_config in self.scheduled_scans.items():
-            if scan_config.next_run:
-                logger.info(
-                    f"Next {scan_type.value} scan scheduled for: "
-                    f"{scan_config.next_run.strftime('%Y-%m-%d %H:%M %Z')}"
-                )
+        # Calculate next run time
+        next_run = now.replace(
+            hour=scan_config.scheduled_time.hour,
+            minute=scan_config.scheduled_time.minute,
+            second=0,
+            microsecond=0
+        )
+        
+        # If time has passed today, schedule for tomorrow
+        if next_run <= now:
+            next_run += timedelta(days=1)
+            
+        scan_config.next_run = next_run
+        scan_config.deadline = next_run.timestamp()
+        heapq.heappush(
+            self._deadlines,
+            (scan_config.deadline, self._deadline_seq(), scan_config.scan_type)
+        )
+        self._scan_status_cache = None
+        
+        # Skip the strftime entirely when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Next %s scan scheduled for: %s",
+                scan_config.scan_type.value,
+                next_run.strftime('%Y-%m-%d %H:%M %Z')
+            )
                 
     async def _start_websocket(self):
         """Start WebSocket connection for real-time data."""
         try:
             if self.config.api.finnhub_key:
+                # Imported here so the websocket client only loads when used
+                from src.data.finnhub import FinnhubWebSocket
+                
                 self._websocket = FinnhubWebSocket()
                 
                 # Start connection task
-                self._websocket_task = asyncio.create_task(
-                    self._manage_websocket()
-                )
+                self._websocket_task = self._spawn("websocket", self._manage_websocket())
                 
                 logger.info("WebSocket connection started")
             else:
                 logger.warning("No Finnhub API key, WebSocket disabled")
                 
         except Exception as e:
-            logger.error(f"Failed to start WebSocket: {e}")
+            logger.error("Failed to start WebSocket: %s", e)
             
     async def _stop_websocket(self):
         """Stop WebSocket connection."""
         if self._websocket_task:
+            self._tasks.pop("websocket", None)
             self._websocket_task.cancel()
             try:
                 await self._websocket_task
             except asyncio.CancelledError:
                 pass
+            self._websocket_task = None
                 
         if self._websocket:
             await self._websocket.disconnect()
@@ -352,33 +540,103 @@ class Scheduler:
         max_reconnect_delay = 300  # 5 minutes
         
         while self._running and self._websocket:
+            connected_at = None
             try:
                 # Connect
                 await self._websocket.connect()
+                connected_at = monotonic()
                 
-                # Reset reconnect delay on successful connection
-                reconnect_delay = 5
-                
-                # Keep connection alive
-                while self._running and self._websocket.connected:
-                    await asyncio.sleep(1)
+                # Block until the connection drops; stop() cancels this task
+                await self._websocket.disconnected_event.wait()
                     
             except Exception as e:
-                logger.error(f"WebSocket error: {e}")
+                logger.error("WebSocket error: %s", e)
+                
+            # Only a connection that held up resets the backoff, so a
+            # flapping connection cannot reconnect in a tight loop
+            if connected_at is not None and monotonic() - connected_at >= STABLE_CONNECTION_SECONDS:
+                reconnect_delay = 5
+                continue
                 
-                # Exponential backoff
-                await asyncio.sleep(reconnect_delay)
-                reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+            # Exponential backoff with full jitter to avoid reconnecting in
+            # lockstep with every other client after a provider outage
+            await asyncio.sleep(random.uniform(0, reconnect_delay))
+            reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
                 
     async def _load_state(self):
         """Load scheduler state from file."""
-        # TODO: Implement state loading from JSON file
-        pass
-        
+        if not os.path.exists(self._state_file):
+            return
+            
+        try:
+            loop = asyncio.get_running_loop()
+            state = await loop.run_in_executor(None, _read_state_file, self._state_file)
+            
+            for scan_type, saved in state.get("scans", {}).items():
+                scan_enum = ScanType(scan_type)
+                hour, minute = map(int, saved["scheduled_time"].split(":"))
+                last_run = saved.get("last_run")
+                
+                scan_config = self.scheduled_scans.get(scan_enum)
+                if scan_config is None:
+                    scan_config = self.scheduled_scans[scan_enum] = ScheduledScan(
+                        scan_type=scan_enum,
+                        scheduled_time=time(hour, minute)
+                    )
+                scan_config.scheduled_time = time(hour, minute)
+                scan_config.enabled = saved.get("enabled", True)
+                scan_config.last_run = datetime.fromisoformat(last_run) if last_run else None
+                
+            self._scan_status_cache = None
+            logger.info(f"Loaded scheduler state from {self._state_file}")
+            
+        except Exception as e:
+            logger.warning(f"Failed to load scheduler state: {e}")
+            
     async def _save_state(self):
-        """Save scheduler state to file."""
-        # TODO: Implement state saving to JSON file
-        pass
+        """Save scheduler state to file.
+        
+        While the scheduler runs, saves are debounced and written by the
+        persistence task; otherwise the state is written immediately.
+        """
+        if "persistence" in self._tasks:
+            self._state_dirty.set()
+        else:
+            await self._write_state()
+            
+    async def _persistence_loop(self):
+        """Write requested state saves, coalescing bursts into one write."""
+        while self._running:
+            await self._state_dirty.wait()
+            await asyncio.sleep(STATE_SAVE_DEBOUNCE)
+            self._state_dirty.clear()
+            await self._write_state()
+            
+    async def _write_state(self):
+        """Serialize current state and write it off the event loop."""
+        state = {
+            "scans": {
+                scan_type.value: {
+                    "scheduled_time": scan_config.scheduled_time.strftime("%H:%M"),
+                    "enabled": scan_config.enabled,
+                    "last_run": scan_config.last_run.isoformat() if scan_config.last_run else None
+                }
+                for scan_type, scan_config in self.scheduled_scans.items()
+            }
+        }
+        
+        # One write at a time: concurrent writers would share the temp file
+        async with self._state_lock:
+            loop = asyncio.get_running_loop()
+            write = loop.run_in_executor(None, _write_state_file, self._state_file, state)
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # The thread keeps writing; hold the lock until it finishes
+                await asyncio.wait([write])
+                raise
+            except Exception as e:
+                logger.error(f"Failed to save scheduler state: {e}")
         
     def get_status(self) -> Dict[str, Any]:
         """Get scheduler status.
@@ -386,21 +644,28 @@ class Scheduler:
         Returns:
             Status dictionary
         """
-        status = {
-            "running": self._running,
-            "websocket_connected": self._websocket and self._websocket.connected,
-            "scheduled_scans": {}
-        }
-        
-        for scan_type, scan_config in self.scheduled_scans.items():
-            status["scheduled_scans"][scan_type.value] = {
-                "enabled": scan_config.enabled,
-                "scheduled_time": scan_config.scheduled_time.isoformat(),
-                "last_run": scan_config.last_run.isoformat() if scan_config.last_run else None,
-                "next_run": scan_config.next_run.isoformat() if scan_config.next_run else None
+        if self._scan_status_cache is None:
+            self._scan_status_cache = {
+                scan_type.value: {
+                    "enabled": scan_config.enabled,
+                    "scheduled_time": scan_config.scheduled_time.isoformat(),
+                    "last_run": (
+                        scan_config.last_run.isoformat(timespec="seconds")
+                        if scan_config.last_run else None
+                    ),
+                    "next_run": (
+                        scan_config.next_run.isoformat(timespec="seconds")
+                        if scan_config.next_run else None
+                    )
+                }
+                for scan_type, scan_config in self.scheduled_scans.items()
             }
             
-        return status
+        return {
+            "running": self._running,
+            "websocket_connected": bool(self._websocket and self._websocket.is_connected),
+            "scheduled_scans": self._scan_status_cache
+        }
     
     def _should_run_on_weekend(self) -> bool:
         """Check if scans should run on weekends.
@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 
+import numpy as np
+
 from src.utils.logger import setup_logger
 from src.orchestration.event_bus import EventBus
 from src.orchestration.events import TradeSignal, EventType
@@ -367,6 +369,49 @@ class TradeJournal:
                 
         return trades
         
+    def get_pnl_array(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status: Optional[str] = 'closed'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get trade timestamps and P&L within a date range as arrays.
+        
+        Reads only the two columns numeric metrics need, skipping the
+        per-row JSON decoding done by get_trades_by_date_range.
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            status: Optional status filter (default: closed trades)
+            
+        Returns:
+            Tuple of (datetime64[us] timestamps, float64 P&L), oldest first
+        """
+        query = (
+            "SELECT timestamp, COALESCE(pnl_eur, 0.0) FROM trades "
+            "WHERE timestamp BETWEEN ? AND ?"
+        )
+        params = [start_date, end_date]
+        
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+            
+        query += " ORDER BY timestamp ASC"
+        
+        with self._get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+            
+        if not rows:
+            return np.empty(0, dtype='datetime64[us]'), np.empty(0, dtype=np.float64)
+            
+        timestamps, pnl = zip(*rows)
+        return (
+            np.array(timestamps, dtype='datetime64[us]'),
+            np.array(pnl, dtype=np.float64)
+        )
+        
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get overall performance summary.
         
@@ -10,7 +10,11 @@ This module calculates various performance metrics including:
 
 import sqlite3
 import json
+import functools
+import threading
+import weakref
 import numpy as np
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
@@ -20,6 +24,84 @@ from src.persistence.journal import TradeJournal
 
 logger = setup_logger(__name__)
 
+# Buffered metric rows are written once this many accumulate...
+METRIC_BUFFER_SIZE = 1000
+
+# ...or by a timer once the oldest buffered row is this old, in seconds
+METRIC_FLUSH_INTERVAL = 5.0
+
+
+def _flush_rows(conn: sqlite3.Connection, rows: List[Tuple[str, str, float, str]]):
+    """Insert buffered rows in a single transaction; caller holds the collector lock."""
+    if not rows:
+        return
+    
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(
+            "INSERT INTO metrics (timestamp, metric_name, value, tags) VALUES (?, ?, ?, ?)",
+            rows
+        )
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    rows.clear()
+
+
+# The timer and finalizer below take the collector's parts rather than the
+# collector itself, so they never keep a dropped collector alive
+
+def _flush_due_rows(conn: sqlite3.Connection, lock: threading.Lock, rows: list):
+    """Flush timer callback."""
+    with lock:
+        try:
+            _flush_rows(conn, rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to flush metrics: {e}")
+
+
+def _close_collector(conn: sqlite3.Connection, lock: threading.Lock, rows: list, timer_box: list):
+    """Flush and close; runs on close(), garbage collection or interpreter exit."""
+    timer = timer_box[0]
+    if timer is not None:
+        timer.cancel()
+    
+    with lock:
+        try:
+            _flush_rows(conn, rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to flush metrics on close: {e}")
+        finally:
+            conn.close()
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a long-lived autocommit connection tuned for frequent small writes.
+    
+    WAL with synchronous=NORMAL lets each INSERT commit without an fsync;
+    durability is only relaxed to the last checkpoint on power loss.
+    """
+    conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_tags(tags_json: str) -> Dict[str, Any]:
+    return json.loads(tags_json)
+
+
+def _parse_tags(tags_json: Optional[str]) -> Dict[str, Any]:
+    """Decode a tags column; points usually repeat a few tag sets, so cache them."""
+    if not tags_json:
+        return {}
+    # Copy so callers cannot mutate the cached dict
+    return dict(_decode_tags(tags_json))
+
 
 class MetricsCollector:
     """Simple metrics collector for testing."""
@@ -27,12 +109,23 @@ class MetricsCollector:
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One shared connection; the lock serializes callers across threads
+        self._conn = _connect(self.db_path)
+        self._lock = threading.Lock()
         self._init_db()
+        
+        # Rows waiting to be inserted together in one transaction
+        self._buf: List[Tuple[str, str, float, str]] = []
+        self._timer_box: List[Optional[threading.Timer]] = [None]
+        self._finalizer = weakref.finalize(
+            self, _close_collector, self._conn, self._lock, self._buf, self._timer_box
+        )
     
     def _init_db(self):
         """Initialize metrics database."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("""
+        with self._lock:
+            self._conn.execute("""
             CREATE TABLE IF NOT EXISTS metrics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp DATETIME NOT NULL,
@@ -41,44 +134,118 @@ class MetricsCollector:
                 tags TEXT
             )
         """)
-        conn.commit()
-        conn.close()
+            # Serves get_metric_series: equality on name, range and order on time
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_metrics_name_ts "
+                "ON metrics(metric_name, timestamp DESC)"
+            )
     
     def record_metric(self, metric_name: str, value: float, tags: Dict[str, Any] = None, timestamp: datetime = None):
-        """Record a metric value."""
-        conn = sqlite3.connect(str(self.db_path))
+        """Record a metric value.
+        
+        Rows are buffered and written in batches; reads flush first, so
+        buffering is invisible to callers of this class.
+        """
         ts = timestamp or datetime.now()
         tags_json = json.dumps(tags or {})
         
-        conn.execute(
-            "INSERT INTO metrics (timestamp, metric_name, value, tags) VALUES (?, ?, ?, ?)",
-            (ts.isoformat(), metric_name, value, tags_json)
-        )
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._buf.append((ts.isoformat(), metric_name, value, tags_json))
+            
+            if len(self._buf) >= METRIC_BUFFER_SIZE:
+                _flush_rows(self._conn, self._buf)
+            else:
+                # At most one timer is pending; it flushes whatever is buffered
+                timer = self._timer_box[0]
+                if timer is None or not timer.is_alive():
+                    timer = threading.Timer(
+                        METRIC_FLUSH_INTERVAL, _flush_due_rows,
+                        (self._conn, self._lock, self._buf)
+                    )
+                    timer.daemon = True
+                    timer.start()
+                    self._timer_box[0] = timer
     
-    def get_metric_series(self, metric_name: str, start_time: datetime, end_time: datetime = None) -> List[Dict[str, Any]]:
-        """Get time series data for a metric."""
-        conn = sqlite3.connect(str(self.db_path))
-        end_time = end_time or datetime.now()
-        
-        cursor = conn.execute(
-            """SELECT timestamp, value, tags FROM metrics 
-               WHERE metric_name = ? AND timestamp >= ? AND timestamp <= ?
-               ORDER BY timestamp DESC""",
-            (metric_name, start_time.isoformat(), end_time.isoformat())
-        )
+    def flush(self):
+        """Write all buffered metric rows to the database."""
+        with self._lock:
+            _flush_rows(self._conn, self._buf)
+    
+    def get_metric_series(
+        self,
+        metric_name: str,
+        start_time: datetime,
+        end_time: datetime = None,
+        include_tags: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get time series data for a metric.
         
-        results = []
-        for row in cursor:
-            results.append({
-                "timestamp": datetime.fromisoformat(row[0]),
-                "value": row[1],
-                "tags": json.loads(row[2]) if row[2] else {}
-            })
+        Args:
+            metric_name: Metric to read
+            start_time: Earliest timestamp to include
+            end_time: Latest timestamp to include (default: now)
+            include_tags: Whether to read and decode each point's tags
+            
+        Returns:
+            Points newest first, each with timestamp, value and optionally tags
+        """
+        end_time = end_time or datetime.now()
+        columns = "timestamp, value, tags" if include_tags else "timestamp, value"
+        
+        with self._lock:
+            _flush_rows(self._conn, self._buf)
+            rows = self._conn.execute(
+                f"""SELECT {columns} FROM metrics 
+                   WHERE metric_name = ? AND timestamp >= ? AND timestamp <= ?
+                   ORDER BY timestamp DESC""",
+                (metric_name, start_time.isoformat(), end_time.isoformat())
+            ).fetchall()
+        
+        parse_time = datetime.fromisoformat
+        if not include_tags:
+            return [{"timestamp": parse_time(ts), "value": value} for ts, value in rows]
+        
+        return [
+            {"timestamp": parse_time(ts), "value": value, "tags": _parse_tags(tags)}
+            for ts, value, tags in rows
+        ]
+    
+    def close(self):
+        """Flush buffered rows and close the database connection.
         
-        conn.close()
-        return results
+        Collectors that are dropped without close() are flushed and closed
+        when garbage collected, or at the latest at interpreter exit.
+        """
+        self._finalizer()
+
+
+def _period_insert(table: str, columns: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+    """Build the upsert for a period table; calculated_at is appended last."""
+    placeholders = ", ".join("?" * (len(columns) + 1))
+    sql = (
+        f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}, calculated_at) "
+        f"VALUES ({placeholders})"
+    )
+    return sql, columns
+
+
+# Fixed statement text per period table, so sqlite3's statement cache reuses
+# the compiled statement across calls on the shared connection
+_PERIOD_INSERTS = {
+    'daily': _period_insert('daily_metrics', (
+        'date', 'total_trades', 'winning_trades', 'losing_trades',
+        'total_pnl', 'win_rate', 'avg_win', 'avg_loss',
+        'largest_win', 'largest_loss'
+    )),
+    'weekly': _period_insert('weekly_metrics', (
+        'week_start', 'week_end', 'total_trades', 'winning_trades',
+        'losing_trades', 'total_pnl', 'win_rate', 'sharpe_ratio'
+    )),
+    'monthly': _period_insert('monthly_metrics', (
+        'month', 'total_trades', 'winning_trades', 'losing_trades',
+        'total_pnl', 'win_rate', 'sharpe_ratio', 'max_drawdown'
+    )),
+}
 
 
 class PerformanceMetrics:
@@ -95,13 +262,27 @@ class PerformanceMetrics:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # One shared connection; the lock serializes callers across threads
+        self._conn = _connect(self.db_path)
+        self._lock = threading.Lock()
+        
         # Initialize metrics database
         self._init_database()
         
+    def close(self):
+        """Close the metrics database connection."""
+        with self._lock:
+            self._conn.close()
+        
     def _init_database(self):
         """Initialize metrics database schema."""
-        conn = sqlite3.connect(str(self.db_path))
+        with self._lock:
+            self._create_tables(self._conn)
+        
+        logger.info(f"Performance metrics database initialized at {self.db_path}")
         
+    def _create_tables(self, conn: sqlite3.Connection):
+        """Create the metrics tables if they do not exist."""
         # Daily metrics table
         conn.execute("""
             CREATE TABLE IF NOT EXISTS daily_metrics (
@@ -149,11 +330,6 @@ class PerformanceMetrics:
             )
         """)
         
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"Performance metrics database initialized at {self.db_path}")
-        
     def calculate_daily_metrics(self, date: datetime) -> Dict[str, Any]:
         """Calculate metrics for a specific day.
         
@@ -167,9 +343,9 @@ class PerformanceMetrics:
         start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
         
-        trades = self.journal.get_trades_by_date_range(start_of_day, end_of_day, status='closed')
+        _, pnl = self.journal.get_pnl_array(start_of_day, end_of_day)
         
-        if not trades:
+        if not pnl.size:
             return {
                 'date': date.date(),
                 'total_trades': 0,
@@ -184,21 +360,7 @@ class PerformanceMetrics:
             }
             
         # Calculate metrics
-        winning_trades = [t for t in trades if t['pnl_eur'] > 0]
-        losing_trades = [t for t in trades if t['pnl_eur'] < 0]
-        
-        metrics = {
-            'date': date.date(),
-            'total_trades': len(trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
-            'total_pnl': sum(t['pnl_eur'] for t in trades),
-            'win_rate': len(winning_trades) / len(trades) if trades else 0.0,
-            'avg_win': np.mean([t['pnl_eur'] for t in winning_trades]) if winning_trades else 0.0,
-            'avg_loss': np.mean([t['pnl_eur'] for t in losing_trades]) if losing_trades else 0.0,
-            'largest_win': max([t['pnl_eur'] for t in winning_trades]) if winning_trades else 0.0,
-            'largest_loss': min([t['pnl_eur'] for t in losing_trades]) if losing_trades else 0.0
-        }
+        metrics = {'date': date.date(), **self._summarize_pnl(pnl)}
         
         # Store in database
         self._store_daily_metrics(metrics)
@@ -220,9 +382,9 @@ class PerformanceMetrics:
         week_end = week_start + timedelta(days=6)
         
         # Get trades for the week
-        trades = self.journal.get_trades_by_date_range(week_start, week_end, status='closed')
+        _, pnl = self.journal.get_pnl_array(week_start, week_end)
         
-        if not trades:
+        if not pnl.size:
             return {
                 'week_start': week_start.date(),
                 'week_end': week_end.date(),
@@ -235,8 +397,7 @@ class PerformanceMetrics:
             }
             
         # Calculate basic metrics
-        winning_trades = [t for t in trades if t['pnl_eur'] > 0]
-        losing_trades = [t for t in trades if t['pnl_eur'] < 0]
+        summary = self._summarize_pnl(pnl)
         
         # Calculate daily returns for Sharpe ratio
         daily_returns = self._calculate_daily_returns(week_start, week_end)
@@ -245,11 +406,11 @@ class PerformanceMetrics:
         metrics = {
             'week_start': week_start.date(),
             'week_end': week_end.date(),
-            'total_trades': len(trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
-            'total_pnl': sum(t['pnl_eur'] for t in trades),
-            'win_rate': len(winning_trades) / len(trades) if trades else 0.0,
+            'total_trades': summary['total_trades'],
+            'winning_trades': summary['winning_trades'],
+            'losing_trades': summary['losing_trades'],
+            'total_pnl': summary['total_pnl'],
+            'win_rate': summary['win_rate'],
             'sharpe_ratio': sharpe_ratio
         }
         
@@ -279,9 +440,9 @@ class PerformanceMetrics:
         last_day = last_day.replace(hour=23, minute=59, second=59, microsecond=999999)
         
         # Get trades for the month
-        trades = self.journal.get_trades_by_date_range(first_day, last_day, status='closed')
+        _, pnl = self.journal.get_pnl_array(first_day, last_day)
         
-        if not trades:
+        if not pnl.size:
             return {
                 'month': first_day.date(),
                 'total_trades': 0,
@@ -294,23 +455,22 @@ class PerformanceMetrics:
             }
             
         # Calculate basic metrics
-        winning_trades = [t for t in trades if t['pnl_eur'] > 0]
-        losing_trades = [t for t in trades if t['pnl_eur'] < 0]
+        summary = self._summarize_pnl(pnl)
         
         # Calculate daily returns for Sharpe ratio
         daily_returns = self._calculate_daily_returns(first_day, last_day)
         sharpe_ratio = self._calculate_sharpe_ratio(daily_returns) if len(daily_returns) >= 5 else None
         
-        # Calculate maximum drawdown
-        max_drawdown = self._calculate_max_drawdown(trades)
+        # Calculate maximum drawdown (P&L arrives in chronological order)
+        max_drawdown = self._max_drawdown_from_pnl(pnl)
         
         metrics = {
             'month': first_day.date(),
-            'total_trades': len(trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
-            'total_pnl': sum(t['pnl_eur'] for t in trades),
-            'win_rate': len(winning_trades) / len(trades) if trades else 0.0,
+            'total_trades': summary['total_trades'],
+            'winning_trades': summary['winning_trades'],
+            'losing_trades': summary['losing_trades'],
+            'total_pnl': summary['total_pnl'],
+            'win_rate': summary['win_rate'],
             'sharpe_ratio': sharpe_ratio,
             'max_drawdown': max_drawdown
         }
@@ -330,11 +490,15 @@ class PerformanceMetrics:
         
         # Add additional calculations
         if summary['closed_trades'] > 0:
-            # Profit factor
-            total_wins = sum(t['pnl_eur'] for t in self.journal.get_recent_trades(10000) 
-                           if t.get('pnl_eur', 0) > 0)
-            total_losses = abs(sum(t['pnl_eur'] for t in self.journal.get_recent_trades(10000) 
-                                 if t.get('pnl_eur', 0) < 0))
+            # Profit factor from a single fetch; open trades have no P&L yet
+            recent = self.journal.get_recent_trades(10000)
+            pnl = np.fromiter(
+                (t.get('pnl_eur') or 0.0 for t in recent),
+                dtype=np.float64,
+                count=len(recent)
+            )
+            total_wins = float(pnl[pnl > 0].sum())
+            total_losses = float(-pnl[pnl < 0].sum())
             
             summary['profit_factor'] = total_wins / total_losses if total_losses > 0 else float('inf')
             
@@ -349,6 +513,31 @@ class PerformanceMetrics:
             
         return summary
         
+    def _summarize_pnl(self, pnl: np.ndarray) -> Dict[str, Any]:
+        """Aggregate win/loss statistics over a non-empty array of closed-trade P&L.
+        
+        Args:
+            pnl: Per-trade P&L in EUR
+            
+        Returns:
+            Dictionary of trade counts, P&L totals and win/loss extremes
+        """
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+        
+        # Plain Python numbers keep the results SQLite- and JSON-friendly
+        return {
+            'total_trades': int(pnl.size),
+            'winning_trades': int(wins.size),
+            'losing_trades': int(losses.size),
+            'total_pnl': float(pnl.sum()),
+            'win_rate': wins.size / pnl.size,
+            'avg_win': float(wins.mean()) if wins.size else 0.0,
+            'avg_loss': float(losses.mean()) if losses.size else 0.0,
+            'largest_win': float(wins.max()) if wins.size else 0.0,
+            'largest_loss': float(losses.min()) if losses.size else 0.0
+        }
+        
     def _calculate_daily_returns(self, start_date: datetime, end_date: datetime) -> List[float]:
         """Calculate daily returns for a date range.
         
@@ -359,26 +548,22 @@ class PerformanceMetrics:
         Returns:
             List of daily returns
         """
-        current = start_date
-        daily_returns = []
-        
-        while current <= end_date:
-            if current.weekday() < 5:  # Trading days only
-                day_trades = self.journal.get_trades_by_date_range(
-                    current.replace(hour=0, minute=0),
-                    current.replace(hour=23, minute=59),
-                    status='closed'
-                )
-                
-                if day_trades:
-                    day_pnl = sum(t['pnl_eur'] for t in day_trades)
-                    # Assume €500 bankroll from PRD
-                    daily_return = day_pnl / 500.0
-                    daily_returns.append(daily_return)
-                    
-            current += timedelta(days=1)
+        # One query for the whole range, bucketed by calendar day
+        timestamps, pnl = self.journal.get_pnl_array(
+            start_date.replace(hour=0, minute=0, second=0, microsecond=0),
+            end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+        )
+        if not pnl.size:
+            return []
             
-        return daily_returns
+        days, day_index = np.unique(timestamps.astype('datetime64[D]'), return_inverse=True)
+        day_pnl = np.bincount(day_index, weights=pnl)
+        
+        # Trading days only; the epoch (day 0) was a Thursday
+        is_weekday = (days.astype(np.int64) + 3) % 7 < 5
+        
+        # Assume €500 bankroll from PRD
+        return (day_pnl[is_weekday] / 500.0).tolist()
         
     def _calculate_sharpe_ratio(self, returns: List[float], risk_free_rate: float = 0.02) -> Optional[float]:
         """Calculate Sharpe ratio from returns.
@@ -425,106 +610,69 @@ class PerformanceMetrics:
             return 0.0
             
         # Sort by timestamp to ensure chronological order
-        sorted_trades = sorted(trades, key=lambda t: t['timestamp'])
+        sorted_trades = sorted(trades, key=itemgetter('timestamp'))
+        pnl = np.fromiter(
+            (t.get('pnl_eur', 0) for t in sorted_trades),
+            dtype=np.float64,
+            count=len(sorted_trades)
+        )
+        
+        return self._max_drawdown_from_pnl(pnl)
         
-        # Calculate cumulative P&L
-        cumulative_pnl = []
-        running_total = 0.0
+    def _max_drawdown_from_pnl(self, pnl: np.ndarray) -> float:
+        """Calculate maximum drawdown from chronological per-trade P&L.
         
-        for trade in sorted_trades:
-            running_total += trade.get('pnl_eur', 0)
-            cumulative_pnl.append(running_total)
+        Args:
+            pnl: Per-trade P&L in time order
             
-        # Calculate drawdown
-        peak = cumulative_pnl[0]
-        max_drawdown = 0.0
+        Returns:
+            Maximum drawdown percentage
+        """
+        if not pnl.size:
+            return 0.0
+            
+        # Cumulative P&L and its running peak
+        cumulative_pnl = np.cumsum(pnl)
+        peak = np.maximum.accumulate(cumulative_pnl)
         
-        for value in cumulative_pnl:
-            if value > peak:
-                peak = value
-            else:
-                drawdown = (peak - value) / peak if peak > 0 else 0
-                max_drawdown = max(max_drawdown, drawdown)
-                
-        return max_drawdown * 100  # Return as percentage
+        # Drawdown relative to the peak, only once the account is in profit
+        safe_peak = np.where(peak > 0, peak, 1.0)
+        drawdown = np.where(peak > 0, (peak - cumulative_pnl) / safe_peak, 0.0)
+        
+        return float(drawdown.max()) * 100  # Return as percentage
         
     def _store_daily_metrics(self, metrics: Dict[str, Any]):
         """Store daily metrics in database."""
-        conn = sqlite3.connect(str(self.db_path))
-        
-        conn.execute("""
-            INSERT OR REPLACE INTO daily_metrics (
-                date, total_trades, winning_trades, losing_trades,
-                total_pnl, win_rate, avg_win, avg_loss,
-                largest_win, largest_loss, calculated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            metrics['date'],
-            metrics['total_trades'],
-            metrics['winning_trades'],
-            metrics['losing_trades'],
-            metrics['total_pnl'],
-            metrics['win_rate'],
-            metrics['avg_win'],
-            metrics['avg_loss'],
-            metrics['largest_win'],
-            metrics['largest_loss'],
-            datetime.now()
-        ))
-        
-        conn.commit()
-        conn.close()
+        self.store_metrics_bulk('daily', [metrics])
         
     def _store_weekly_metrics(self, metrics: Dict[str, Any]):
         """Store weekly metrics in database."""
-        conn = sqlite3.connect(str(self.db_path))
-        
-        conn.execute("""
-            INSERT OR REPLACE INTO weekly_metrics (
-                week_start, week_end, total_trades, winning_trades,
-                losing_trades, total_pnl, win_rate, sharpe_ratio,
-                calculated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            metrics['week_start'],
-            metrics['week_end'],
-            metrics['total_trades'],
-            metrics['winning_trades'],
-            metrics['losing_trades'],
-            metrics['total_pnl'],
-            metrics['win_rate'],
-            metrics['sharpe_ratio'],
-            datetime.now()
-        ))
-        
-        conn.commit()
-        conn.close()
+        self.store_metrics_bulk('weekly', [metrics])
         
     def _store_monthly_metrics(self, metrics: Dict[str, Any]):
         """Store monthly metrics in database."""
-        conn = sqlite3.connect(str(self.db_path))
+        self.store_metrics_bulk('monthly', [metrics])
         
-        conn.execute("""
-            INSERT OR REPLACE INTO monthly_metrics (
-                month, total_trades, winning_trades, losing_trades,
-                total_pnl, win_rate, sharpe_ratio, max_drawdown,
-                calculated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            metrics['month'],
-            metrics['total_trades'],
-            metrics['winning_trades'],
-            metrics['losing_trades'],
-            metrics['total_pnl'],
-            metrics['win_rate'],
-            metrics['sharpe_ratio'],
-            metrics['max_drawdown'],
-            datetime.now()
-        ))
-        
-        conn.commit()
-        conn.close()
+    def store_metrics_bulk(self, period: str, rows: List[Dict[str, Any]]):
+        """Store many period metric rows in a single transaction.
         
+        Args:
+            period: 'daily', 'weekly', or 'monthly'
+            rows: Metrics dictionaries as returned by calculate_*_metrics
+        """
+        sql, columns = _PERIOD_INSERTS[period]
+        calculated_at = datetime.now()
+        params = [tuple(row[column] for column in columns) + (calculated_at,) for row in rows]
+        
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(sql, params)
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            
     def get_metrics_by_period(self, period: str = 'daily', limit: int = 30) -> List[Dict[str, Any]]:
         """Get historical metrics by period.
         
@@ -535,19 +683,16 @@ class PerformanceMetrics:
         Returns:
             List of metrics for the period
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        
         table_name = f"{period}_metrics"
         order_field = 'date' if period == 'daily' else 'week_start' if period == 'weekly' else 'month'
         
-        cursor = conn.execute(f"""
-            SELECT * FROM {table_name}
-            ORDER BY {order_field} DESC
-            LIMIT ?
-        """, (limit,))
-        
-        metrics = [dict(row) for row in cursor]
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute(f"""
+                SELECT * FROM {table_name}
+                ORDER BY {order_field} DESC
+                LIMIT ?
+            """, (limit,))
+            columns = [col[0] for col in cursor.description]
+            metrics = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
         return metrics
\ No newline at end of file
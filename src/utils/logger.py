@@ -3,16 +3,24 @@ Logging configuration for ODTA
 Provides structured logging with color support and rotation
 """
 
+import functools
 import logging
 import sys
+from logging.handlers import MemoryHandler, RotatingFileHandler
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 import colorama
 from colorama import Fore, Style
 
-# Initialize colorama for Windows support
-colorama.init()
+# Enable ANSI colors on Windows consoles; a no-op elsewhere, and unlike
+# colorama.init() it does not wrap sys.stdout/sys.stderr with a filter
+colorama.just_fix_windows_console()
+
+# Log file rotation and buffering
+LOG_FILE_MAX_BYTES = 50 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+LOG_BUFFER_CAPACITY = 512
 
 # Custom log colors
 LOG_COLORS = {
@@ -29,18 +37,40 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, use_colors=True):
         super().__init__(fmt, datefmt)
         self.use_colors = use_colors and sys.stderr.isatty()
+        
+        # ANSI-wrapped level and logger names, built once rather than per record
+        self._colored_levels = {
+            level: f"{color}{level}{Style.RESET_ALL}" for level, color in LOG_COLORS.items()
+        }
+        self._colored_names = {}
+        self._cached_second = None
+        self._cached_time = ""
+    
+    def formatTime(self, record, datefmt=None):
+        """Format the record time, reusing the string within the same second"""
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
     
     def format(self, record):
-        if self.use_colors:
-            levelname = record.levelname
-            if levelname in LOG_COLORS:
-                record.levelname = f"{LOG_COLORS[levelname]}{levelname}{Style.RESET_ALL}"
-                record.name = f"{Fore.BLUE}{record.name}{Style.RESET_ALL}"
-        
-        # Add custom fields
-        record.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        if not self.use_colors or record.levelname not in self._colored_levels:
+            return super().format(record)
         
-        return super().format(record)
+        # Swap in colored fields only while this handler formats, then restore
+        # so file handlers sharing the record stay free of ANSI codes
+        levelname, name = record.levelname, record.name
+        colored_name = self._colored_names.get(name)
+        if colored_name is None:
+            colored_name = self._colored_names[name] = f"{Fore.BLUE}{name}{Style.RESET_ALL}"
+            
+        record.levelname = self._colored_levels[levelname]
+        record.name = colored_name
+        try:
+            return super().format(record)
+        finally:
+            record.levelname, record.name = levelname, name
 
 class StructuredLogger:
     """Wrapper for structured logging with context"""
@@ -48,6 +78,13 @@ class StructuredLogger:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.context = {}
+        
+        # Bound once so each call skips the attribute and level-name lookups
+        self._debug = logger.debug
+        self._info = logger.info
+        self._warning = logger.warning
+        self._error = logger.error
+        self._critical = logger.critical
     
     def add_context(self, **kwargs):
         """Add persistent context to all log messages"""
@@ -57,27 +94,40 @@ class StructuredLogger:
         """Clear all context"""
         self.context = {}
     
-    def _log(self, level, msg, *args, **kwargs):
-        """Internal log method with context injection"""
-        extra = kwargs.get('extra', {})
-        extra.update(self.context)
-        kwargs['extra'] = extra
-        getattr(self.logger, level)(msg, *args, **kwargs)
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message of this level would be emitted"""
+        return self.logger.isEnabledFor(level)
+    
+    def _merge_context(self, kwargs):
+        """Merge persistent context into a call's extra without mutating it"""
+        kwargs['extra'] = {**kwargs.get('extra', {}), **self.context}
     
+    # Each method calls the bound logger method directly; the level check
+    # only guards the context merge, the logger repeats it before emitting
     def debug(self, msg, *args, **kwargs):
-        self._log('debug', msg, *args, **kwargs)
+        if self.context and self.logger.isEnabledFor(logging.DEBUG):
+            self._merge_context(kwargs)
+        self._debug(msg, *args, **kwargs)
     
     def info(self, msg, *args, **kwargs):
-        self._log('info', msg, *args, **kwargs)
+        if self.context and self.logger.isEnabledFor(logging.INFO):
+            self._merge_context(kwargs)
+        self._info(msg, *args, **kwargs)
     
     def warning(self, msg, *args, **kwargs):
-        self._log('warning', msg, *args, **kwargs)
+        if self.context and self.logger.isEnabledFor(logging.WARNING):
+            self._merge_context(kwargs)
+        self._warning(msg, *args, **kwargs)
     
     def error(self, msg, *args, **kwargs):
-        self._log('error', msg, *args, **kwargs)
+        if self.context and self.logger.isEnabledFor(logging.ERROR):
+            self._merge_context(kwargs)
+        self._error(msg, *args, **kwargs)
     
     def critical(self, msg, *args, **kwargs):
-        self._log('critical', msg, *args, **kwargs)
+        if self.context and self.logger.isEnabledFor(logging.CRITICAL):
+            self._merge_context(kwargs)
+        self._critical(msg, *args, **kwargs)
 
 def setup_logger(
     name: str,
@@ -108,29 +158,50 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers
+    # Remove existing handlers, flushing any buffered file records first
+    for handler in logger.handlers:
+        # MemoryHandler.close() drops its target, so grab the file handler first
+        target = handler.target if isinstance(handler, MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
     logger.handlers = []
     
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stderr)
-    console_format = "%(timestamp)s [%(levelname)s] %(name)s: %(message)s"
-    console_formatter = ColoredFormatter(console_format, use_colors=use_colors)
+    console_format = "%(asctime)s.%(msecs)03d [%(levelname)s] %(name)s: %(message)s"
+    console_formatter = ColoredFormatter(
+        console_format, datefmt="%Y-%m-%d %H:%M:%S", use_colors=use_colors
+    )
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
     
-    # File handler (if specified)
+    # File handler (if specified): rotated, opened on first write, and fed
+    # through a memory buffer so records reach the disk in bursts. ERROR and
+    # above flush immediately; logging's exit hook flushes the rest.
     if log_file:
-        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUPS,
+            encoding='utf-8',
+            delay=True
+        )
         file_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         file_formatter = logging.Formatter(file_format)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+        ))
     
     # Prevent propagation to root logger
     logger.propagate = False
     
     return StructuredLogger(logger)
 
+# Loggers already configured by get_logger, by name
+_LOGGER_CACHE: Dict[str, StructuredLogger] = {}
+
 def get_logger(name: str) -> StructuredLogger:
     """
     Get or create a logger instance
@@ -141,36 +212,37 @@ def get_logger(name: str) -> StructuredLogger:
     Returns:
         StructuredLogger instance
     """
-    return setup_logger(name)
+    # Configure each name once; setup_logger would rebuild its handlers
+    structured = _LOGGER_CACHE.get(name)
+    if structured is None:
+        structured = _LOGGER_CACHE[name] = setup_logger(name)
+    return structured
 
 # Performance logging decorator
 def log_performance(logger: Optional[StructuredLogger] = None):
     """Decorator to log function performance"""
-    import functools
-    import time
-    
     def decorator(func):
+        # Resolved once per decorated function rather than on every call
+        func_logger = logger or get_logger(func.__module__)
+        name = func.__name__
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            nonlocal logger
-            if logger is None:
-                logger = get_logger(func.__module__)
-            
-            start_time = time.time()
-            logger.debug(f"Starting {func.__name__}")
+            start_time = time.perf_counter()
+            func_logger.debug("Starting %s", name)
             
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.info(
-                    f"Completed {func.__name__}",
+                elapsed = time.perf_counter() - start_time
+                func_logger.info(
+                    "Completed %s", name,
                     extra={'duration_ms': int(elapsed * 1000)}
                 )
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(
-                    f"Failed {func.__name__}: {str(e)}",
+                elapsed = time.perf_counter() - start_time
+                func_logger.error(
+                    "Failed %s: %s", name, e,
                     extra={'duration_ms': int(elapsed * 1000)},
                     exc_info=True
                 )
@@ -182,31 +254,28 @@ def log_performance(logger: Optional[StructuredLogger] = None):
 # Async performance logging decorator
 def log_async_performance(logger: Optional[StructuredLogger] = None):
     """Decorator to log async function performance"""
-    import functools
-    import time
-    
     def decorator(func):
+        # Resolved once per decorated function rather than on every call
+        func_logger = logger or get_logger(func.__module__)
+        name = func.__name__
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            nonlocal logger
-            if logger is None:
-                logger = get_logger(func.__module__)
-            
-            start_time = time.time()
-            logger.debug(f"Starting async {func.__name__}")
+            start_time = time.perf_counter()
+            func_logger.debug("Starting async %s", name)
             
             try:
                 result = await func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                logger.info(
-                    f"Completed async {func.__name__}",
+                elapsed = time.perf_counter() - start_time
+                func_logger.info(
+                    "Completed async %s", name,
                     extra={'duration_ms': int(elapsed * 1000)}
                 )
                 return result
             except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(
-                    f"Failed async {func.__name__}: {str(e)}",
+                elapsed = time.perf_counter() - start_time
+                func_logger.error(
+                    "Failed async %s: %s", name, e,
                     extra={'duration_ms': int(elapsed * 1000)},
                     exc_info=True
                 )
@@ -4,22 +4,66 @@ Tracks usage and enforces limits across all providers
 """
 
 import asyncio
+import atexit
+import io
 import json
+import os
+import sys
+import threading
 import time
 import csv
+import weakref
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Callable, Any, List
+from typing import Dict, Optional, Callable, Any, List, Tuple
 import functools
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # Optional C serializer; stdlib json is the fallback
+    orjson = None
+
 from ..config.settings import get_config
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Usage changes are written to the state file at most this often, in seconds
+QUOTA_SAVE_INTERVAL = 5.0
+
+# Header of the usage CSV log
+USAGE_LOG_COLUMNS = [
+    'timestamp', 'provider', 'endpoint', 'count',
+    'usage_before', 'usage_after', 'limit', 'percentage',
+    'period', 'success', 'error_message'
+]
+
+# Guards that may hold unsaved usage, flushed at interpreter exit
+_live_guards: "weakref.WeakSet[QuotaGuard]" = weakref.WeakSet()
+
+
+def _csv_field(value: str) -> str:
+    """Quote a free-text CSV field the way csv.writer's minimal quoting does"""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_minute(timestamp: str) -> datetime:
+    """Parse a 'YYYY-MM-DDTHH:MM' usage timestamp prefix"""
+    return datetime.fromisoformat(timestamp)
+
+
+@atexit.register
+def _flush_live_guards():
+    for guard in list(_live_guards):
+        guard.flush_state()
+        guard.close()
+
 class QuotaPeriod(Enum):
     """Quota reset periods"""
     MINUTE = "minute"
@@ -27,15 +71,57 @@ class QuotaPeriod(Enum):
     DAY = "day"
     MONTH = "month"
 
-@dataclass
+# Length of each period in seconds; a month is approximated as 30 days
+_PERIOD_SECONDS = {
+    QuotaPeriod.MINUTE: 60,
+    QuotaPeriod.HOUR: 3600,
+    QuotaPeriod.DAY: 86400,
+    QuotaPeriod.MONTH: 2592000,
+}
+
+@dataclass(slots=True)
 class QuotaInfo:
-    """Information about a single quota"""
+    """
+    Information about a single quota
+    
+    last_reset and last_call are wall-clock times for persistence and
+    display. Reset checks compare against a deadline on the monotonic
+    clock so clock steps cannot skip or force a reset; call restore()
+    rather than assigning last_reset directly to keep the two in step.
+    """
     provider: str
     limit: int
     period: QuotaPeriod
     used: int = 0
     last_reset: float = field(default_factory=time.time)
     last_call: float = field(default_factory=time.time)
+    # Derived from period so the hot path never touches the enum
+    period_seconds: int = field(init=False, repr=False, compare=False)
+    period_name: str = field(init=False, repr=False, compare=False)
+    _next_reset_monotonic: float = field(init=False, repr=False, compare=False)
+    # Usage counts above which the 80% and 90% warnings are logged
+    _warn_at: int = field(init=False, repr=False, compare=False)
+    _critical_at: int = field(init=False, repr=False, compare=False)
+    _last_call_iso: str = field(default="", init=False, repr=False, compare=False)
+    _last_call_iso_at: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.period_seconds = _PERIOD_SECONDS[self.period]
+        self.period_name = self.period.value
+        self._sync_next_reset()
+        
+        # Integer division keeps "used > _warn_at" identical to "> 80%";
+        # a zero limit never warns, as usage_percentage is then 0
+        if self.limit > 0:
+            self._warn_at = self.limit * 8 // 10
+            self._critical_at = self.limit * 9 // 10
+        else:
+            self._warn_at = self._critical_at = sys.maxsize
+    
+    def _sync_next_reset(self):
+        """Map the wall-clock last_reset onto a monotonic reset deadline"""
+        reset_monotonic = time.monotonic() - (time.time() - self.last_reset)
+        self._next_reset_monotonic = reset_monotonic + self.period_seconds
     
     @property
     def remaining(self) -> int:
@@ -49,29 +135,32 @@ class QuotaInfo:
             return 0.0
         return (self.used / self.limit) * 100
     
+    @property
+    def last_call_iso(self) -> str:
+        """ISO-8601 form of last_call, formatted again only when it changes"""
+        if self._last_call_iso_at != self.last_call:
+            self._last_call_iso = datetime.fromtimestamp(self.last_call).isoformat()
+            self._last_call_iso_at = self.last_call
+        return self._last_call_iso
+    
     @property
     def should_reset(self) -> bool:
         """Check if quota should be reset based on period"""
-        now = time.time()
-        elapsed = now - self.last_reset
-        
-        if self.period == QuotaPeriod.MINUTE:
-            return elapsed >= 60
-        elif self.period == QuotaPeriod.HOUR:
-            return elapsed >= 3600
-        elif self.period == QuotaPeriod.DAY:
-            return elapsed >= 86400
-        elif self.period == QuotaPeriod.MONTH:
-            # Approximate month as 30 days
-            return elapsed >= 2592000
-        
-        return False
+        return time.monotonic() >= self._next_reset_monotonic
+    
+    def restore(self, used: int, last_reset: float, last_call: float):
+        """Restore persisted usage, with wall-clock timestamps"""
+        self.used = used
+        self.last_reset = last_reset
+        self.last_call = last_call
+        self._sync_next_reset()
     
     def reset(self):
         """Reset quota counter"""
         self.used = 0
         self.last_reset = time.time()
-        logger.info(f"Reset quota for {self.provider}: {self.limit} per {self.period.value}")
+        self._next_reset_monotonic = time.monotonic() + self.period_seconds
+        logger.info(f"Reset quota for {self.provider}: {self.limit} per {self.period_name}")
     
     def increment(self, count: int = 1):
         """Increment usage counter"""
@@ -85,20 +174,40 @@ class QuotaExhausted(Exception):
         self.quota_info = quota_info
         super().__init__(
             f"Quota exhausted for {provider}: "
-            f"{quota_info.used}/{quota_info.limit} per {quota_info.period.value}"
+            f"{quota_info.used}/{quota_info.limit} per {quota_info.period_name}"
         )
 
 class QuotaGuard:
-    """Manages API quotas across all providers"""
+    """
+    Manages API quotas across all providers
+    
+    A guard is meant to be used from a single event loop. The counter
+    updates never await, so each check or consume runs to completion
+    without interleaving and needs no lock.
+    """
     
     def __init__(self, quota_file: Optional[Path] = None, usage_log_file: Optional[Path] = None):
         self.config = get_config()
         self.quotas: Dict[str, QuotaInfo] = {}
         self.quota_file = quota_file or self.config.system.logs_dir / "quota_state.json"
         self.usage_log_file = usage_log_file or self.config.system.logs_dir / "quota_usage.csv"
-        self._lock = asyncio.Lock()
         self._fallback_callbacks: Dict[str, Callable] = {}
         
+        # Debounced persistence: consumers only mark the state dirty
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._last_write = 0.0
+        # File writes run off the event loop and must not interleave
+        self._write_lock = threading.Lock()
+        _live_guards.add(self)
+        
+        # Usage rows are queued and appended in batches by one writer task
+        # through a handle that stays open between writes
+        self._usage_pending: List[Tuple[str, asyncio.Future]] = []
+        self._usage_writer: Optional[asyncio.Task] = None
+        self._usage_handle = None
+        self._usage_handle_lock = threading.Lock()
+        
         # Initialize quotas from config
         self._initialize_quotas()
         
@@ -107,6 +216,10 @@ class QuotaGuard:
         
         # Initialize usage log
         self._init_usage_log()
+        
+        # Usage aggregates, folded in from the CSV as it grows
+        self._usage_lock = threading.Lock()
+        self._reset_usage_aggregate()
     
     def _initialize_quotas(self):
         """Initialize quota tracking from configuration"""
@@ -134,15 +247,18 @@ class QuotaGuard:
         """Load saved quota state from file"""
         if self.quota_file.exists():
             try:
-                with open(self.quota_file, 'r') as f:
-                    state = json.load(f)
+                raw = self.quota_file.read_bytes()
+                state = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 
                 for provider, data in state.items():
                     if provider in self.quotas:
                         quota = self.quotas[provider]
-                        quota.used = data.get('used', 0)
-                        quota.last_reset = data.get('last_reset', time.time())
-                        quota.last_call = data.get('last_call', time.time())
+                        now = time.time()
+                        quota.restore(
+                            used=data.get('used', 0),
+                            last_reset=data.get('last_reset', now),
+                            last_call=data.get('last_call', now)
+                        )
                         
                         # Check if reset needed
                         if quota.should_reset:
@@ -152,23 +268,77 @@ class QuotaGuard:
             except Exception as e:
                 logger.warning(f"Failed to load quota state: {e}")
     
-    def _save_state(self):
-        """Save current quota state to file"""
+    def _snapshot_state(self) -> Dict[str, Dict[str, float]]:
+        """Copy the persisted fields of every quota"""
+        return {
+            provider: {
+                'used': quota.used,
+                'last_reset': quota.last_reset,
+                'last_call': quota.last_call
+            }
+            for provider, quota in self.quotas.items()
+        }
+    
+    def _write_state(self, state: Dict[str, Dict[str, float]]):
+        """Write a state snapshot to file; blocking, safe to run in a thread"""
         try:
-            state = {}
-            for provider, quota in self.quotas.items():
-                state[provider] = {
-                    'used': quota.used,
-                    'last_reset': quota.last_reset,
-                    'last_call': quota.last_call
-                }
-            
-            self.quota_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.quota_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            with self._write_lock:
+                self.quota_file.parent.mkdir(parents=True, exist_ok=True)
+                if orjson is not None:
+                    data = orjson.dumps(state)
+                else:
+                    data = json.dumps(state, separators=(',', ':')).encode('utf-8')
+                
+                # Replace atomically so a crash never leaves a truncated file
+                tmp_path = f"{self.quota_file}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.quota_file)
+                self._last_write = time.monotonic()
         except Exception as e:
             logger.error(f"Failed to save quota state: {e}")
     
+    def _save_state(self):
+        """Save current quota state to file"""
+        self._write_state(self._snapshot_state())
+    
+    def _take_dirty_state(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """Snapshot the state if it has unsaved changes and mark it clean"""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return self._snapshot_state()
+    
+    def _schedule_save(self):
+        """Mark the state dirty and make sure a delayed save is pending"""
+        self._dirty = True
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Synchronous caller: write inline, at most once per interval
+            if time.monotonic() - self._last_write >= QUOTA_SAVE_INTERVAL:
+                self.flush_state()
+            return
+        
+        task = self._save_task
+        # A task left on a previous, closed loop will never run
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._save_task = loop.create_task(self._save_later())
+    
+    async def _save_later(self):
+        """Write the state once the save interval has passed"""
+        await asyncio.sleep(QUOTA_SAVE_INTERVAL)
+        state = self._take_dirty_state()
+        if state is not None:
+            await asyncio.to_thread(self._write_state, state)
+    
+    def flush_state(self):
+        """Write the quota state now if it has unsaved changes"""
+        state = self._take_dirty_state()
+        if state is not None:
+            self._write_state(state)
+    
     async def check_quota(self, provider: str, count: int = 1) -> bool:
         """
         Check if quota is available for provider
@@ -180,30 +350,45 @@ class QuotaGuard:
         Returns:
             True if quota available, False otherwise
         """
-        async with self._lock:
-            if provider not in self.quotas:
-                logger.warning(f"Unknown provider: {provider}")
-                return True
-            
-            quota = self.quotas[provider]
-            
-            # Reset if needed
-            if quota.should_reset:
-                quota.reset()
-            
-            # Check availability
-            if quota.remaining >= count:
-                return True
-            
-            # Log warning when approaching limit
-            if quota.usage_percentage > 80:
-                logger.warning(
-                    f"Quota warning for {provider}: "
-                    f"{quota.usage_percentage:.1f}% used "
-                    f"({quota.used}/{quota.limit})"
-                )
+        return self._has_quota(provider, count)
+    
+    async def check_quotas(self, providers: Dict[str, int]) -> bool:
+        """
+        Check if quota is available for several providers at once
+        
+        Args:
+            providers: Dict of provider -> count needed
             
-            return False
+        Returns:
+            True if all quotas available, stopping at the first that is not
+        """
+        return all(self._has_quota(provider, count) for provider, count in providers.items())
+    
+    def _has_quota(self, provider: str, count: int) -> bool:
+        """Check a single provider's quota, resetting it if its period has passed"""
+        if provider not in self.quotas:
+            logger.warning(f"Unknown provider: {provider}")
+            return True
+        
+        quota = self.quotas[provider]
+        
+        # Reset if needed
+        if quota.should_reset:
+            quota.reset()
+        
+        # Check availability
+        if quota.remaining >= count:
+            return True
+        
+        # Log warning when approaching limit
+        if quota.used > quota._warn_at:
+            logger.warning(
+                f"Quota warning for {provider}: "
+                f"{quota.usage_percentage:.1f}% used "
+                f"({quota.used}/{quota.limit})"
+            )
+        
+        return False
     
     async def consume_quota(self, provider: str, count: int = 1, endpoint: str = ""):
         """
@@ -217,44 +402,90 @@ class QuotaGuard:
         Raises:
             QuotaExhausted: If quota would be exceeded
         """
-        async with self._lock:
-            if provider not in self.quotas:
-                logger.warning(f"Unknown provider: {provider}, not tracking quota")
-                return
-            
-            quota = self.quotas[provider]
-            
-            # Reset if needed
-            if quota.should_reset:
-                quota.reset()
+        # Counters are updated without awaiting; file writes happen after
+        # so other callers are not held up on disk
+        taken = self._take_quota(provider, count, endpoint)
+        if taken is None:
+            return
+        quota, exhausted, row = taken
+        
+        await self._log_usage(row)
+        
+        if exhausted:
+            # Trigger fallback callback if registered
+            if provider in self._fallback_callbacks:
+                logger.info(f"Triggering fallback for {provider}")
+                await self._fallback_callbacks[provider]()
             
-            # Check if we can consume
-            if quota.remaining < count:
-                # Log failed attempt
-                self._log_usage(provider, count, endpoint, success=False, 
-                              error_message="Quota exhausted")
-                
-                # Trigger fallback callback if registered
-                if provider in self._fallback_callbacks:
-                    logger.info(f"Triggering fallback for {provider}")
-                    await self._fallback_callbacks[provider]()
-                
-                raise QuotaExhausted(provider, quota)
+            raise QuotaExhausted(provider, quota)
+        
+        self._warn_high_usage(quota)
+    
+    def consume_quota_sync(self, provider: str, count: int = 1, endpoint: str = ""):
+        """
+        Consume quota for a provider from synchronous code
+        
+        Registered fallbacks are coroutines and are only triggered by
+        consume_quota.
+        
+        Args:
+            provider: API provider name
+            count: Number of calls made
+            endpoint: Optional endpoint identifier for logging
             
-            # Consume quota
+        Raises:
+            QuotaExhausted: If quota would be exceeded
+        """
+        taken = self._take_quota(provider, count, endpoint)
+        if taken is None:
+            return
+        quota, exhausted, row = taken
+        
+        self._append_usage_rows([row])
+        
+        if exhausted:
+            raise QuotaExhausted(provider, quota)
+        
+        self._warn_high_usage(quota)
+    
+    def _take_quota(self, provider: str, count: int,
+                    endpoint: str) -> Optional[Tuple[QuotaInfo, bool, str]]:
+        """
+        Update the counters for a consume call
+        
+        Returns:
+            (quota, exhausted, usage row), or None for an unknown provider
+        """
+        if provider not in self.quotas:
+            logger.warning(f"Unknown provider: {provider}, not tracking quota")
+            return None
+        
+        quota = self.quotas[provider]
+        
+        # Reset if needed
+        if quota.should_reset:
+            quota.reset()
+        
+        exhausted = quota.remaining < count
+        if exhausted:
+            row = self._usage_row(quota, count, endpoint, success=False,
+                                  error_message="Quota exhausted")
+        else:
+            # Consume quota; the state file is written by the debounced save
             quota.increment(count)
-            self._save_state()
-            
-            # Log successful usage
-            self._log_usage(provider, count, endpoint, success=True)
-            
-            # Log if high usage
-            if quota.usage_percentage > 90:
-                logger.warning(
-                    f"High quota usage for {provider}: "
-                    f"{quota.usage_percentage:.1f}% "
-                    f"({quota.remaining} remaining)"
-                )
+            self._schedule_save()
+            row = self._usage_row(quota, count, endpoint, success=True)
+        
+        return quota, exhausted, row
+    
+    def _warn_high_usage(self, quota: QuotaInfo):
+        """Log a warning when a quota is nearly used up"""
+        if quota.used > quota._critical_at:
+            logger.warning(
+                f"High quota usage for {quota.provider}: "
+                f"{quota.usage_percentage:.1f}% "
+                f"({quota.remaining} remaining)"
+            )
     
     def register_fallback(self, provider: str, callback: Callable):
         """Register a fallback callback for when quota is exhausted"""
@@ -265,27 +496,29 @@ class QuotaGuard:
         """Get current quota status for all providers"""
         status = {}
         for provider, quota in self.quotas.items():
-            # Reset check
-            if quota.should_reset:
-                quota.reset()
+            # An expired window reads as empty; the reset itself is left to
+            # the next check or consume so this getter has no side effects
+            used = 0 if quota.should_reset else quota.used
             
             status[provider] = {
-                'used': quota.used,
+                'used': used,
                 'limit': quota.limit,
-                'remaining': quota.remaining,
-                'percentage': round(quota.usage_percentage, 1),
-                'period': quota.period.value,
-                'last_call': datetime.fromtimestamp(quota.last_call).isoformat()
+                'remaining': max(0, quota.limit - used),
+                'percentage': round(used / quota.limit * 100, 1) if quota.limit else 0.0,
+                'period': quota.period_name,
+                'last_call': quota.last_call_iso
             }
         return status
     
     async def reset_all(self):
         """Force reset all quotas (useful for testing)"""
-        async with self._lock:
-            for quota in self.quotas.values():
-                quota.reset()
-            self._save_state()
-            logger.info("Reset all quotas")
+        for quota in self.quotas.values():
+            quota.reset()
+        self._dirty = False
+        state = self._snapshot_state()
+        
+        await asyncio.to_thread(self._write_state, state)
+        logger.info("Reset all quotas")
     
     def _init_usage_log(self):
         """Initialize usage log CSV file if it doesn't exist or is empty"""
@@ -297,42 +530,143 @@ class QuotaGuard:
         
         if not has_content:
             with open(self.usage_log_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'provider', 'endpoint', 'count', 
-                    'usage_before', 'usage_after', 'limit', 'percentage',
-                    'period', 'success', 'error_message'
-                ])
+                csv.writer(f).writerow(USAGE_LOG_COLUMNS)
             logger.info(f"Created quota usage log at {self.usage_log_file}")
     
-    def _log_usage(self, provider: str, count: int, endpoint: str = "", 
-                   success: bool = True, error_message: str = ""):
-        """Log API usage to CSV file"""
+    def _usage_row(self, quota: QuotaInfo, count: int, endpoint: str = "",
+                   success: bool = True, error_message: str = "") -> str:
+        """
+        Build a usage log line from the quota's current counters
+        
+        The line is formatted directly rather than through csv.writer; only
+        the free-text fields can need quoting, and they get the same
+        minimal quoting csv.writer would apply.
+        """
+        return (
+            f"{datetime.now().isoformat()},{quota.provider},{_csv_field(endpoint)},"
+            f"{count},{quota.used - count},{quota.used},{quota.limit},"
+            f"{round(quota.usage_percentage, 2)},{quota.period_name},"
+            f"{success},{_csv_field(error_message)}\r\n"
+        )
+    
+    async def _log_usage(self, row: str):
+        """Queue a usage row and wait until it has been written"""
+        loop = asyncio.get_running_loop()
+        written = loop.create_future()
+        self._usage_pending.append((row, written))
+        
+        task = self._usage_writer
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._usage_writer = loop.create_task(self._write_usage_rows())
+        await written
+    
+    async def _write_usage_rows(self):
+        """Append queued usage rows, one batch per thread hop, until none are left"""
+        while self._usage_pending:
+            batch, self._usage_pending = self._usage_pending, []
+            await asyncio.to_thread(self._append_usage_rows, [row for row, _ in batch])
+            for _, written in batch:
+                # A caller cancelled while waiting has already given up
+                if not written.done():
+                    written.set_result(None)
+    
+    def _append_usage_rows(self, rows: List[str]):
+        """Append formatted rows to the usage CSV; blocking, safe to run in a thread"""
         try:
-            quota = self.quotas.get(provider)
-            if not quota:
-                return
-                
-            with open(self.usage_log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    provider,
-                    endpoint,
-                    count,
-                    quota.used - count,  # usage before
-                    quota.used,  # usage after
-                    quota.limit,
-                    round(quota.usage_percentage, 2),
-                    quota.period.value,
-                    success,
-                    error_message
-                ])
+            with self._usage_handle_lock:
+                if self._usage_handle is None:
+                    self._usage_handle = open(self.usage_log_file, 'a', newline='')
+                self._usage_handle.write(''.join(rows))
+                self._usage_handle.flush()
         except Exception as e:
             logger.error(f"Failed to log quota usage: {e}")
     
+    def close(self):
+        """Close the usage log handle; it is reopened on the next write"""
+        with self._usage_handle_lock:
+            if self._usage_handle is not None:
+                self._usage_handle.close()
+                self._usage_handle = None
+    
+    def _reset_usage_aggregate(self):
+        """Forget the usage aggregates so the CSV is read again from the start"""
+        self._usage_offset = 0
+        self._usage_columns = {name: i for i, name in enumerate(USAGE_LOG_COLUMNS)}
+        # day -> provider -> calls/success/failed/endpoints
+        self._usage_by_day: Dict[date, Dict[str, Dict[str, Any]]] = defaultdict(
+            lambda: defaultdict(lambda: {
+                'calls': 0, 'success': 0, 'failed': 0,
+                'endpoints': defaultdict(int)
+            })
+        )
+        # day -> minute -> provider -> calls, for windows starting mid-day
+        self._usage_by_minute: Dict[date, Dict[datetime, Dict[str, int]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(int))
+        )
+    
+    def _refresh_usage_aggregate(self):
+        """Fold rows appended to the usage CSV since the last refresh"""
+        try:
+            size = self.usage_log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        
+        if size < self._usage_offset:
+            # The log was truncated or replaced
+            self._reset_usage_aggregate()
+        if size == self._usage_offset:
+            return
+        
+        with open(self.usage_log_file, 'rb') as f:
+            f.seek(self._usage_offset)
+            chunk = f.read(size - self._usage_offset)
+        
+        # A row still being written is left for the next refresh
+        end = chunk.rfind(b'\n') + 1
+        if not end:
+            return
+        self._usage_offset += end
+        
+        for row in csv.reader(io.StringIO(chunk[:end].decode('utf-8'), newline='')):
+            if row and row[0] == 'timestamp':
+                self._usage_columns = {name: i for i, name in enumerate(row)}
+                continue
+            self._fold_usage_row(row)
+    
+    def _fold_usage_row(self, row: List[str]):
+        """Add one usage CSV row to the aggregates"""
+        columns = self._usage_columns
+        try:
+            # Aggregates only need the minute, and rows within a minute
+            # share the prefix, so most rows are a cache hit
+            minute = _parse_minute(row[columns['timestamp']][:16])
+            provider = row[columns['provider']]
+            count = int(row[columns['count']])
+            endpoint = row[columns['endpoint']]
+            success = row[columns['success']] == 'True'
+        except (KeyError, IndexError, ValueError):
+            return
+        
+        day = minute.date()
+        stats = self._usage_by_day[day][provider]
+        stats['calls'] += count
+        if success:
+            stats['success'] += count
+        else:
+            stats['failed'] += count
+        if endpoint:
+            stats['endpoints'][endpoint] += count
+        
+        self._usage_by_minute[day][minute][provider] += count
+    
     def get_usage_summary(self, days: int = 7) -> Dict[str, Any]:
-        """Get usage summary for the last N days"""
+        """
+        Get usage summary for the last N days
+        
+        Totals come from in-memory aggregates, so only rows appended since
+        the previous call are parsed. The window start is resolved to the
+        minute.
+        """
         summary = {
             'by_provider': defaultdict(lambda: {'total_calls': 0, 'total_cost': 0}),
             'by_day': defaultdict(lambda: defaultdict(int)),
@@ -344,26 +678,28 @@ class QuotaGuard:
             if not self.usage_log_file.exists():
                 return dict(summary)
                 
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff = datetime.now() - timedelta(days=days)
+            cutoff_day = cutoff.date()
+            cutoff_minute = cutoff.replace(second=0, microsecond=0)
             
-            with open(self.usage_log_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        timestamp = datetime.fromisoformat(row['timestamp'])
-                    except (KeyError, ValueError):
-                        continue
-                    if timestamp < cutoff_date:
-                        continue
-                        
-                    provider = row['provider']
-                    count = int(row['count'])
-                    day = timestamp.date().isoformat()
-                    
-                    # Update summaries
-                    summary['by_provider'][provider]['total_calls'] += count
-                    summary['by_day'][day][provider] += count
-                    summary['total_calls'] += count
+            def add(day: date, provider: str, count: int):
+                summary['by_provider'][provider]['total_calls'] += count
+                summary['by_day'][day.isoformat()][provider] += count
+                summary['total_calls'] += count
+            
+            with self._usage_lock:
+                self._refresh_usage_aggregate()
+                
+                # Whole days after the cutoff, then the part of the cutoff day
+                for day, providers in self._usage_by_day.items():
+                    if day > cutoff_day:
+                        for provider, stats in providers.items():
+                            add(day, provider, stats['calls'])
+                
+                for minute, providers in self._usage_by_minute.get(cutoff_day, {}).items():
+                    if minute >= cutoff_minute:
+                        for provider, count in providers.items():
+                            add(cutoff_day, provider, count)
                     
             # Calculate estimated costs (placeholder - adjust based on actual pricing)
             cost_per_call = {
@@ -390,53 +726,21 @@ class QuotaGuard:
         summary_file = self.config.system.logs_dir / f"quota_daily_{date.strftime('%Y%m%d')}.csv"
         
         try:
-            # Get all usage for the date
-            start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-            
-            daily_usage = defaultdict(lambda: {
-                'calls': 0, 'success': 0, 'failed': 0, 
-                'endpoints': defaultdict(int)
-            })
-            
             if not self.usage_log_file.exists():
                 # No data to export
                 return None
-                
-            with open(self.usage_log_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        timestamp = datetime.fromisoformat(row['timestamp'])
-                    except (KeyError, ValueError):
-                        continue
-                    if start_of_day <= timestamp <= end_of_day:
-                        provider = row['provider']
-                        count = int(row['count'])
-                        endpoint = row['endpoint']
-                        success = row['success'] == 'True'
-                        
-                        daily_usage[provider]['calls'] += count
-                        if success:
-                            daily_usage[provider]['success'] += count
-                        else:
-                            daily_usage[provider]['failed'] += count
-                        if endpoint:
-                            daily_usage[provider]['endpoints'][endpoint] += count
-                            
-            # Write summary
-            with open(summary_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Date', date.strftime('%Y-%m-%d')])
-                writer.writerow([])
-                writer.writerow(['Provider', 'Total Calls', 'Successful', 'Failed', 'Success Rate', 'Top Endpoints'])
-                
+            
+            # Get all usage for the date
+            with self._usage_lock:
+                self._refresh_usage_aggregate()
+                daily_usage = self._usage_by_day.get(date.date(), {})
+                rows = []
                 for provider, data in daily_usage.items():
                     success_rate = (data['success'] / data['calls'] * 100) if data['calls'] > 0 else 0
                     top_endpoints = sorted(data['endpoints'].items(), key=lambda x: x[1], reverse=True)[:3]
                     endpoints_str = ', '.join([f"{ep}({cnt})" for ep, cnt in top_endpoints])
                     
-                    writer.writerow([
+                    rows.append([
                         provider,
                         data['calls'],
                         data['success'],
@@ -444,6 +748,17 @@ class QuotaGuard:
                         f"{success_rate:.1f}%",
                         endpoints_str
                     ])
+                            
+            # Write summary
+            with open(summary_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Date', date.strftime('%Y-%m-%d')])
+                writer.writerow([])
+                writer.writerow([
+                    'Provider', 'Total Calls', 'Successful', 'Failed',
+                    'Success Rate', 'Top Endpoints'
+                ])
+                writer.writerows(rows)
                     
             logger.info(f"Exported daily summary to {summary_file}")
             return summary_file
@@ -476,25 +791,24 @@ def rate_limit(provider: str, count: int = 1, endpoint: str = ""):
         # Use function name as endpoint if not provided
         endpoint_name = endpoint or func.__name__
         
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            guard = get_quota_guard()
-            await guard.consume_quota(provider, count, endpoint_name)
-            return await func(*args, **kwargs)
+        # Only build the wrapper that matches the function type
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # Read the singleton directly; only the first call has to build it
+                guard = _quota_guard or get_quota_guard()
+                await guard.consume_quota(provider, count, endpoint_name)
+                return await func(*args, **kwargs)
+            
+            return async_wrapper
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            guard = get_quota_guard()
-            # Run async consume_quota in sync context
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(guard.consume_quota(provider, count, endpoint_name))
+            guard = _quota_guard or get_quota_guard()
+            guard.consume_quota_sync(provider, count, endpoint_name)
             return func(*args, **kwargs)
         
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
@@ -509,8 +823,4 @@ async def check_multi_quota(providers: Dict[str, int]) -> bool:
     Returns:
         True if all quotas available
     """
-    guard = get_quota_guard()
-    for provider, count in providers.items():
-        if not await guard.check_quota(provider, count):
-            return False
-    return True
\ No newline at end of file
+    return await get_quota_guard().check_quotas(providers)
\ No newline at end of file
@@ -8,7 +8,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 
-from src.data.cache import CacheService
+from src.data import cache as cache_module
+from src.data.cache import CacheService, CacheStore
 from src.data.cache_manager import CacheManager
 from src.data.base import Quote, Headline
 from src.config.settings import get_config
@@ -71,6 +72,55 @@ class TestCacheIntegration:
         assert cached_quotes["AAPL"].symbol == "AAPL"
         assert cached_quotes["AAPL"].price == 150.0
 
+    @pytest.mark.asyncio
+    async def test_cache_store_mget(self, tmp_path):
+        """Test multi-key lookup across memory and disk cache."""
+        store = CacheStore(cache_dir=tmp_path / "store")
+        await store.set('market', {'symbol': 'AAPL'}, {'price': 150.0}, 60)
+        await store.set('market', {'symbol': 'MSFT'}, {'price': 380.0}, 60)
+        
+        # Fresh store has an empty memory cache, so hits come from disk
+        fresh = CacheStore(cache_dir=tmp_path / "store")
+        results = await fresh.mget('market', [
+            {'symbol': 'AAPL'},
+            {'symbol': 'GOOGL'},
+            {'symbol': 'MSFT'}
+        ])
+        
+        assert results == [{'price': 150.0}, None, {'price': 380.0}]
+        assert len(fresh._memory_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_store_delete(self, tmp_path):
+        """Test deleting a single entry from memory and disk cache."""
+        store = CacheStore(cache_dir=tmp_path / "store")
+        await store.set('universe', {'key': 'a'}, ['AAPL'], 60)
+        await store.set('universe', {'key': 'b'}, ['MSFT'], 60)
+        
+        await store.delete('universe', {'key': 'a'})
+        
+        assert await store.get('universe', {'key': 'a'}) is None
+        fresh = CacheStore(cache_dir=tmp_path / "store")
+        assert await fresh.get('universe', {'key': 'a'}) is None
+        assert await fresh.get('universe', {'key': 'b'}) == ['MSFT']
+
+    @pytest.mark.asyncio
+    async def test_cache_store_delete_many(self, tmp_path):
+        """Test deleting several entries with one cache file rewrite."""
+        store = CacheStore(cache_dir=tmp_path / "store")
+        await store.set('universe', {'key': 'a'}, ['AAPL'], 60)
+        await store.set('universe', {'key': 'b'}, ['MSFT'], 60)
+        await store.set('universe', {'key': 'c'}, ['JPM'], 60)
+        
+        with patch('src.data.cache._write_json', wraps=cache_module._write_json) as write:
+            await store.delete_many('universe', [{'key': 'a'}, {'key': 'b'}])
+        
+        assert write.call_count == 1
+        fresh = CacheStore(cache_dir=tmp_path / "store")
+        assert await fresh.get('universe', {'key': 'a'}) is None
+        assert await fresh.get('universe', {'key': 'b'}) is None
+        assert await fresh.get('universe', {'key': 'c'}) == ['JPM']
+
     def test_concurrent_cache_access(self, cache_service):
         """Test concurrent read/write operations."""
         async def write_task(key, value):
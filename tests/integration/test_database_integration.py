@@ -337,6 +337,120 @@ class TestDatabaseIntegration:
         # Verify ordering (newest first)
         assert scan_metrics[0]["value"] > scan_metrics[-1]["value"]
 
+    def test_metric_series_tags_optional(self, metrics_collector):
+        """Test reading a series with and without decoded tags."""
+        for i in range(3):
+            metrics_collector.record_metric("cache_hits", float(i), {"source": "test"})
+        start = datetime.now() - timedelta(minutes=1)
+        
+        tagged = metrics_collector.get_metric_series("cache_hits", start_time=start)
+        assert [p["tags"] for p in tagged] == [{"source": "test"}] * 3
+        
+        # Decoded tags are per point, not shared
+        tagged[0]["tags"]["source"] = "changed"
+        assert tagged[1]["tags"] == {"source": "test"}
+        
+        untagged = metrics_collector.get_metric_series(
+            "cache_hits", start_time=start, include_tags=False
+        )
+        assert [p["value"] for p in untagged] == [p["value"] for p in tagged]
+        assert all("tags" not in p for p in untagged)
+
+    def test_metric_series_uses_index(self, metrics_collector):
+        """Test that metric series queries seek the composite index."""
+        plan = metrics_collector._conn.execute(
+            """EXPLAIN QUERY PLAN SELECT timestamp, value, tags FROM metrics
+               WHERE metric_name = ? AND timestamp >= ? AND timestamp <= ?
+               ORDER BY timestamp DESC""",
+            ("scan_duration", "2024-01-01", "2024-01-02")
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        
+        assert "idx_metrics_name_ts" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_metrics_collector_shared_connection(self, metrics_collector):
+        """Test concurrent metric writes through the shared WAL connection."""
+        journal_mode = metrics_collector._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+        
+        def record(thread_id):
+            for i in range(50):
+                metrics_collector.record_metric("latency", float(i), {"thread": thread_id})
+        
+        threads = [threading.Thread(target=record, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        series = metrics_collector.get_metric_series(
+            "latency",
+            start_time=datetime.now() - timedelta(minutes=1)
+        )
+        assert len(series) == 200
+        
+        # Reads flush the buffer, so a fresh reader sees every row
+        conn = sqlite3.connect(str(metrics_collector.db_path))
+        assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 200
+        conn.close()
+        
+        metrics_collector.close()
+
+    def test_metrics_collector_batches_inserts(self, metrics_collector):
+        """Test that metric rows are buffered until flushed or read."""
+        def stored_rows():
+            conn = sqlite3.connect(str(metrics_collector.db_path))
+            count = conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+            conn.close()
+            return count
+        
+        for i in range(3):
+            metrics_collector.record_metric("api_calls", float(i))
+        assert stored_rows() == 0
+        
+        metrics_collector.flush()
+        assert stored_rows() == 3
+        
+        # A read sees rows that are still buffered
+        metrics_collector.record_metric("api_calls", 3.0)
+        series = metrics_collector.get_metric_series(
+            "api_calls",
+            start_time=datetime.now() - timedelta(minutes=1)
+        )
+        assert len(series) == 4
+        
+        metrics_collector.close()
+
+    def test_metrics_collector_flushes_when_dropped(self, tmp_path):
+        """Test that a collector dropped without close() still writes its rows."""
+        import gc
+        db_path = tmp_path / "dropped.db"
+        
+        collector = MetricsCollector(str(db_path))
+        collector.record_metric("api_calls", 1.0)
+        del collector
+        gc.collect()
+        
+        conn = sqlite3.connect(str(db_path))
+        assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 1
+        conn.close()
+    
+    def test_metrics_collector_interval_flush_is_timed(self, tmp_path, monkeypatch):
+        """Test that a lone buffered row is written once the interval passes."""
+        import src.persistence.metrics as metrics_module
+        monkeypatch.setattr(metrics_module, "METRIC_FLUSH_INTERVAL", 0.05)
+        db_path = tmp_path / "timed.db"
+        
+        collector = MetricsCollector(str(db_path))
+        collector.record_metric("api_calls", 1.0)
+        time.sleep(0.3)
+        
+        conn = sqlite3.connect(str(db_path))
+        assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 1
+        conn.close()
+        collector.close()
+
     def test_database_connection_pooling(self, tmp_path):
         """Test connection pooling under load."""
         db_path = tmp_path / "pool_test.db"
@@ -44,6 +44,18 @@ class TestDataModels:
         assert quote.low == 148.0
         assert quote.prev_close == 149.0
 
+    def test_quote_to_dict(self):
+        """Test Quote serializes to a JSON-ready dict."""
+        timestamp = datetime.now()
+        quote = Quote(symbol="AAPL", timestamp=timestamp, price=150.0, prev_close=149.0)
+        
+        data = quote.to_dict()
+        
+        assert data["timestamp"] == timestamp.isoformat()
+        assert data["prev_close"] == 149.0
+        assert json.loads(json.dumps(data)) == data
+        assert not hasattr(quote, "__dict__")
+
     def test_news_creation(self):
         """Test News model creation and attributes."""
         timestamp = datetime.now()
@@ -211,6 +223,63 @@ class TestFinnhubWebSocket:
             assert finnhub_adapter.is_connected
             assert "AAPL" in finnhub_adapter.subscribed_symbols
 
+    @pytest.mark.asyncio
+    async def test_disconnected_event(self, finnhub_adapter):
+        """Test that the disconnect signal tracks the connection state."""
+        assert finnhub_adapter.disconnected_event.is_set()
+        
+        mock_ws = AsyncMock()
+        with patch('websockets.connect', AsyncMock(return_value=mock_ws)):
+            await finnhub_adapter.connect()
+        assert not finnhub_adapter.disconnected_event.is_set()
+        
+        await finnhub_adapter.disconnect()
+        assert finnhub_adapter.disconnected_event.is_set()
+        assert finnhub_adapter.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_server_side_close_is_detected(self, finnhub_adapter):
+        """Test that a socket closed by the server, without disconnect(), triggers a reconnect."""
+        from src.orchestration import EventBus, Scheduler
+        
+        sockets = []
+        
+        def make_socket():
+            closed = asyncio.Event()
+            ws = AsyncMock()
+            ws.wait_closed = closed.wait
+            ws.server_close = closed.set
+            sockets.append(ws)
+            return ws
+        
+        scheduler = Scheduler(EventBus())
+        scheduler._running = True
+        scheduler._websocket = finnhub_adapter
+        
+        with patch('websockets.connect', AsyncMock(side_effect=lambda url: make_socket())):
+            manager = asyncio.create_task(scheduler._manage_websocket())
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert len(sockets) == 1
+            assert not finnhub_adapter.disconnected_event.is_set()
+            
+            sockets[0].server_close()
+            with patch('src.orchestration.scheduler.random.uniform', return_value=0.0):
+                for _ in range(20):
+                    await asyncio.sleep(0)
+                    if len(sockets) == 2:
+                        break
+            
+            assert len(sockets) == 2
+            assert finnhub_adapter.websocket is sockets[1]
+            assert finnhub_adapter.is_connected
+            sockets[0].close.assert_awaited()
+            
+            scheduler._running = False
+            manager.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await manager
+
     @pytest.mark.asyncio
     async def test_quote_parsing(self, finnhub_adapter):
         """Test quote callback mechanism."""
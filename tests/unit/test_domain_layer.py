@@ -1,5 +1,6 @@
 """Unit tests for domain layer components."""
 
+import itertools
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
@@ -317,6 +318,40 @@ class TestFactorModel:
         # Check that custom weights are reflected in the scoring
         assert len(scored) == 1
 
+    def test_factor_matrix_matches_scalar_scoring(self, factor_model):
+        """Test that batch scoring agrees with per-candidate scoring."""
+        gaps = []
+        for i, (gap_percent, price, options) in enumerate(itertools.product(
+            [-12.0, -6.0, 2.0, 4.0, 7.5, 15.0],
+            [3.0, 8.0, 50.0, 150.0, 500.0],
+            [None, "calls", "puts"]
+        )):
+            gaps.append(GapResult(
+                symbol=f"SYM{i}",
+                gap_percent=gap_percent,
+                gap_type=list(GapType)[i % len(GapType)],
+                current_price=price,
+                prev_close=price / (1 + gap_percent / 100),
+                volume=1000000,
+                volume_ratio=0.5 + (i % 7) * 0.6,
+                atr=None if i % 5 == 0 else price * 0.02,
+                news_count=i % 8,
+                short_interest=None if i % 3 else 25.0,
+                options_activity=options
+            ))
+        
+        matrix = factor_model._score_factor_matrix(gaps)
+        
+        assert matrix.shape == (len(gaps), 4)
+        for gap, row in zip(gaps, matrix):
+            expected = [
+                factor_model._score_volatility(gap),
+                factor_model._score_catalyst(gap),
+                factor_model._score_sentiment(gap),
+                factor_model._score_liquidity(gap)
+            ]
+            assert row.tolist() == pytest.approx(expected)
+
 
 class TestTradePlanner:
     """Test trade planning functionality."""
@@ -566,14 +601,36 @@ class TestUniverseManager:
             high=151.0,
             low=149.0
         )
-        universe_manager.market_data.get_quote = AsyncMock(return_value=quote)
+        universe_manager.market_data.get_quotes = AsyncMock(
+            side_effect=lambda batch: {symbol: quote for symbol in batch}
+        )
         
         # Test get_active_symbols
         symbols = await universe_manager.get_active_symbols()
         
         # Should validate all symbols
         assert isinstance(symbols, list)
-        assert universe_manager.market_data.get_quote.called
+        assert universe_manager.market_data.get_quotes.called
+
+    @pytest.mark.asyncio
+    async def test_validate_batch_fetches_quotes_once(self, universe_manager):
+        """Test that a batch is resolved by one get_quotes call without a separate cache read."""
+        quote = Quote(
+            symbol="AAPL",
+            timestamp=datetime.now(),
+            price=150.0,
+            volume=1000000
+        )
+        universe_manager.cache.get_quotes_bulk = AsyncMock()
+        universe_manager.market_data.get_quotes = AsyncMock(
+            return_value={"AAPL": quote, "GOOGL": None}
+        )
+        
+        active = await universe_manager._validate_batch(["AAPL", "GOOGL"])
+        
+        assert active == ["AAPL"]
+        universe_manager.market_data.get_quotes.assert_awaited_once_with(["AAPL", "GOOGL"])
+        universe_manager.cache.get_quotes_bulk.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_symbol_validation(self, universe_manager):
@@ -604,6 +661,9 @@ class TestUniverseManager:
         
         # Test valid symbol
         assert await universe_manager.validate_symbol("AAPL") is True
+        info = await universe_manager.get_symbol_info("AAPL")
+        assert info["price"] == 150.0
+        assert info["adv"] == 150.0 * 100000
         
         # Test invalid symbol (price too low)
         assert await universe_manager.validate_symbol("PENNY") is False
@@ -615,7 +675,7 @@ class TestUniverseManager:
     async def test_refresh_universe(self, universe_manager):
         """Test refreshing universe from file."""
         # Mock cache operations
-        universe_manager.cache.store.delete = AsyncMock()
+        universe_manager.cache.store.delete_many = AsyncMock()
         universe_manager.cache.store.get = AsyncMock(return_value=None)
         universe_manager.cache.store.set = AsyncMock()
         
@@ -623,4 +683,4 @@ class TestUniverseManager:
         symbols = await universe_manager.refresh_universe()
         
         assert len(symbols) == 5
-        assert universe_manager.cache.store.delete.called  # Should clear cache
\ No newline at end of file
+        assert universe_manager.cache.store.delete_many.called  # Should clear cache
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Unit tests for logger configuration."""
+
+import logging
+from logging.handlers import MemoryHandler
+
+from src.utils.logger import setup_logger
+
+
+class TestSetupLogger:
+    """Test setup_logger handler management."""
+
+    def test_reconfigure_closes_previous_log_file(self, tmp_path):
+        """Test that reconfiguring a logger closes the old rotating file handler."""
+        log_file = tmp_path / "app.log"
+        logger = setup_logger("test_logger_reconfigure", log_file=log_file)
+        logger.error("first")  # ERROR flushes the buffer and opens the file
+
+        handlers = logging.getLogger("test_logger_reconfigure").handlers
+        buffered = next(h for h in handlers if isinstance(h, MemoryHandler))
+        file_handler = buffered.target
+        old_stream = file_handler.stream
+        assert old_stream is not None and not old_stream.closed
+
+        setup_logger("test_logger_reconfigure", log_file=log_file)
+
+        assert old_stream.closed
+        assert file_handler.stream is None
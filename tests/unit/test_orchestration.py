@@ -1,13 +1,15 @@
 """Unit tests for the orchestration layer."""
 import pytest
 import asyncio
+import threading
+import time
 from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.orchestration import (
     EventBus, Event, EventType, EventPriority,
-    ScanRequest, TradeSignal, SystemStatus, ErrorEvent,
-    Scheduler, Coordinator
+    ScanRequest, TradeSignal, SystemStatus, ErrorEvent, DataUpdateBatch,
+    Scheduler, ScanType, Coordinator
 )
 from src.domain.planner import TradePlan, EntryStrategy, ExitStrategy
 
@@ -88,6 +90,126 @@ class TestEventBus:
         
         await bus.stop()
         
+    @pytest.mark.asyncio
+    async def test_queue_full_drops_events(self):
+        """Test that events beyond max_queue_size are dropped."""
+        bus = EventBus(max_queue_size=2)
+        await bus.start()
+        
+        async def handler(event: Event):
+            pass
+        
+        await bus.subscribe(Event, handler)
+        
+        # publish() does not yield, so the worker cannot drain in between
+        for _ in range(3):
+            await bus.publish(Event())
+            
+        metrics = bus.get_metrics()
+        assert metrics["events_published"] == 2
+        assert metrics["events_dropped"] == 1
+        
+        await bus.stop()
+        assert bus.get_metrics()["events_processed"] == 2
+        
+    @pytest.mark.asyncio
+    async def test_publish_without_subscribers_skips_queue(self):
+        """Test that events nobody listens to never enter the queue."""
+        bus = EventBus()
+        await bus.start()
+        
+        await bus.publish(SystemStatus(component="test", status="running"))
+        
+        metrics = bus.get_metrics()
+        assert metrics["events_published"] == 0
+        assert metrics["events_no_subscribers"] == 1
+        assert metrics["queue_size"] == 0
+        
+        await bus.stop()
+        
+    @pytest.mark.asyncio
+    async def test_queue_full_keeps_urgent_events(self):
+        """Test that HIGH events displace NORMAL ones and CRITICAL always fit."""
+        bus = EventBus(max_queue_size=2)
+        await bus.start()
+        
+        received = []
+        
+        async def handler(event: Event):
+            received.append(event.priority.name)
+        
+        await bus.subscribe(Event, handler)
+        
+        await bus.publish(Event(priority=EventPriority.NORMAL))
+        await bus.publish(Event(priority=EventPriority.HIGH))
+        await bus.publish(Event(priority=EventPriority.HIGH))      # evicts NORMAL
+        await bus.publish(Event(priority=EventPriority.HIGH))      # nothing to evict
+        await bus.publish(Event(priority=EventPriority.CRITICAL))  # over capacity
+        
+        assert bus.get_metrics()["events_dropped"] == 2
+        
+        await bus.stop()
+        assert received == ["CRITICAL", "HIGH", "HIGH"]
+        
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_in_executor(self):
+        """Test that sync handlers run on the bus executor."""
+        bus = EventBus()
+        await bus.start()
+        
+        received_events = []
+        handler_threads = []
+        
+        def handler(event: ScanRequest):
+            received_events.append(event)
+            handler_threads.append(threading.current_thread().name)
+        
+        await bus.subscribe(ScanRequest, handler)
+        assert bus._subscribers[ScanRequest][0].is_coro is False
+        
+        await bus.publish(ScanRequest(scan_type="primary"))
+        await asyncio.sleep(0.1)
+        
+        assert len(received_events) == 1
+        assert handler_threads[0].startswith("evbus")
+        
+        await bus.stop()
+        
+    @pytest.mark.asyncio
+    async def test_base_event_subscribers(self):
+        """Test that base Event subscribers see each event exactly once."""
+        bus = EventBus()
+        await bus.start()
+        
+        specific_events = []
+        all_events = []
+        
+        async def specific_handler(event: ScanRequest):
+            specific_events.append(event)
+        
+        async def catch_all(event: Event):
+            all_events.append(event)
+        
+        await bus.subscribe(ScanRequest, specific_handler)
+        await bus.subscribe(Event, catch_all)
+        
+        for _ in range(3):
+            await bus.publish(ScanRequest(scan_type="primary"))
+        await asyncio.sleep(0.1)
+        
+        assert len(specific_events) == 3
+        assert len(all_events) == 3
+        
+        # Unsubscribing invalidates the cached dispatch list
+        await bus.unsubscribe(Event, catch_all)
+        await bus.publish(ScanRequest(scan_type="primary"))
+        await asyncio.sleep(0.1)
+        
+        assert len(specific_events) == 4
+        assert len(all_events) == 3
+        
+        await bus.stop()
+        
     @pytest.mark.asyncio
     async def test_error_isolation(self):
         """Test that handler errors don't crash the bus."""
@@ -120,7 +242,35 @@ class TestEventBus:
         assert any(isinstance(e, SystemStatus) for e in good_events)
         
         await bus.stop()
-
+        
+    @pytest.mark.asyncio
+    async def test_repeated_handler_errors_coalesced(self):
+        """Test that an error storm from one handler yields one ErrorEvent."""
+        bus = EventBus(error_coalesce_window=60.0)
+        await bus.start()
+        
+        errors = []
+        
+        async def bad_handler(event: ScanRequest):
+            raise ValueError("Test error")
+        
+        async def error_handler(event: ErrorEvent):
+            errors.append(event)
+        
+        await bus.subscribe(ScanRequest, bad_handler)
+        await bus.subscribe(ErrorEvent, error_handler)
+        
+        for _ in range(3):
+            await bus.publish(ScanRequest(scan_type="primary"))
+        await asyncio.sleep(0.1)
+        
+        assert len(errors) == 1
+        assert errors[0].component == "bad_handler"
+        assert "ValueError" in errors[0].traceback
+        assert bus.get_metrics()["errors_coalesced"] == 2
+        
+        await bus.stop()
+        
 
 class TestScheduler:
     """Test Scheduler functionality."""
@@ -151,6 +301,7 @@ class TestScheduler:
         # Check scan request published
         assert len(scan_requests) == 1
         assert scan_requests[0].scan_type == "primary"
+        assert scan_requests[0].priority == EventPriority.HIGH
         
         await bus.stop()
         
@@ -165,6 +316,210 @@ class TestScheduler:
         assert "websocket_connected" in status
         assert "scheduled_scans" in status
         assert status["running"] is False
+        
+    @pytest.mark.asyncio
+    async def test_scheduler_status_tracks_schedule_changes(self, tmp_path):
+        """Test that cached scan status is refreshed after a schedule edit."""
+        scheduler = Scheduler(EventBus())
+        scheduler._state_file = str(tmp_path / "scheduler_state.json")
+        
+        before = scheduler.get_status()["scheduled_scans"]["primary"]
+        assert scheduler.get_status()["scheduled_scans"]["primary"] is before
+        
+        await scheduler.schedule_scan("15:30", "primary")
+        
+        after = scheduler.get_status()["scheduled_scans"]["primary"]
+        assert after["scheduled_time"] == "15:30:00"
+        assert after["next_run"] is not None
+        
+    @pytest.mark.asyncio
+    async def test_scheduler_stop_cancels_tasks_together(self, tmp_path):
+        """Test that stop() tears down background tasks in parallel."""
+        bus = EventBus()
+        await bus.start()
+        
+        scheduler = Scheduler(bus)
+        scheduler._state_file = str(tmp_path / "scheduler_state.json")
+        
+        async def slow_to_cancel():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.2)
+                raise
+        
+        tasks = [scheduler._spawn(f"slow-{i}", slow_to_cancel()) for i in range(3)]
+        await asyncio.sleep(0)
+        
+        started = time.monotonic()
+        await scheduler.stop()
+        
+        assert time.monotonic() - started < 0.5
+        assert all(task.cancelled() for task in tasks)
+        assert scheduler._tasks == {}
+        
+        await bus.stop()
+        
+    @pytest.mark.asyncio
+    async def test_stop_before_start_keeps_saved_state(self, tmp_path):
+        """Test that stopping a never-started scheduler leaves its state file alone."""
+        state_file = tmp_path / "scheduler_state.json"
+        
+        scheduler = Scheduler(EventBus())
+        scheduler._state_file = str(state_file)
+        await scheduler.schedule_scan("15:30", "primary")
+        await scheduler._write_state()
+        saved = state_file.read_bytes()
+        
+        fresh = Scheduler(EventBus())
+        fresh._state_file = str(state_file)
+        await fresh.stop()
+        
+        assert state_file.read_bytes() == saved
+        
+    @pytest.mark.asyncio
+    async def test_cancelled_state_write_is_not_interleaved(self, tmp_path):
+        """Test that a cancelled save finishes before the next one starts."""
+        import src.orchestration.scheduler as scheduler_module
+        
+        scheduler = Scheduler(EventBus())
+        scheduler._state_file = str(tmp_path / "scheduler_state.json")
+        
+        real_write = scheduler_module._write_state_file
+        active = []
+        overlaps = []
+        
+        def slow_write(path, state):
+            overlaps.append(bool(active))
+            active.append(1)
+            threading.Event().wait(0.1)
+            real_write(path, state)
+            active.pop()
+        
+        with patch.object(scheduler_module, "_write_state_file", slow_write):
+            first = asyncio.create_task(scheduler._write_state())
+            await asyncio.sleep(0.02)
+            first.cancel()
+            await scheduler._write_state()
+            
+        assert first.cancelled()
+        assert overlaps == [False, False]
+        assert "primary" in scheduler_module._read_state_file(scheduler._state_file)["scans"]
+        
+    @pytest.mark.asyncio
+    async def test_scheduler_loop_fires_due_scan(self, tmp_path):
+        """Test that the loop fires a due scan and wakes promptly on stop."""
+        bus = EventBus()
+        await bus.start()
+        
+        scan_requests = []
+        
+        async def handler(event: ScanRequest):
+            scan_requests.append(event)
+        
+        await bus.subscribe(ScanRequest, handler)
+        
+        scheduler = Scheduler(bus)
+        scheduler._state_file = str(tmp_path / "scheduler_state.json")
+        scheduler.scheduled_scans[ScanType.SECOND_LOOK].enabled = False
+        due = datetime.now(scheduler.cet) - timedelta(seconds=1)
+        scheduler.scheduled_scans[ScanType.PRIMARY].next_run = due
+        scheduler.scheduled_scans[ScanType.PRIMARY].deadline = due.timestamp()
+        # A superseded entry for the same scan must not fire it twice
+        scheduler._deadlines = [
+            (due.timestamp() - 60, 0, ScanType.PRIMARY),
+            (due.timestamp(), 1, ScanType.PRIMARY),
+        ]
+        scheduler._running = True
+        loop_task = asyncio.create_task(scheduler._scheduler_loop())
+        
+        await asyncio.sleep(0.1)
+        assert [r.scan_type for r in scan_requests] == ["primary"]
+        assert scheduler.scheduled_scans[ScanType.PRIMARY].next_run > datetime.now(scheduler.cet)
+        assert scheduler._deadlines[0][0] == scheduler.scheduled_scans[ScanType.PRIMARY].deadline
+        
+        # The loop is now sleeping until tomorrow; stopping must wake it
+        scheduler._running = False
+        scheduler._wakeup.set()
+        await asyncio.wait_for(loop_task, timeout=1.0)
+        
+        await bus.stop()
+        
+    @pytest.mark.asyncio
+    async def test_scan_rescheduled_when_error_publish_fails(self, tmp_path):
+        """Test that a scan keeps its heap entry when its error report raises."""
+        async def publish(event):
+            if isinstance(event, ErrorEvent) and event.error_type == "scheduled_scan_error":
+                raise RuntimeError("bus down")
+            if isinstance(event, ScanRequest):
+                raise RuntimeError("scan request rejected")
+        
+        bus = Mock()
+        bus.publish = AsyncMock(side_effect=publish)
+        
+        scheduler = Scheduler(bus)
+        scheduler._state_file = str(tmp_path / "scheduler_state.json")
+        scheduler.scheduled_scans[ScanType.SECOND_LOOK].enabled = False
+        due = datetime.now(scheduler.cet) - timedelta(seconds=1)
+        scheduler.scheduled_scans[ScanType.PRIMARY].next_run = due
+        scheduler.scheduled_scans[ScanType.PRIMARY].deadline = due.timestamp()
+        scheduler._deadlines = [(due.timestamp(), 0, ScanType.PRIMARY)]
+        scheduler._running = True
+        loop_task = asyncio.create_task(scheduler._scheduler_loop())
+        
+        await asyncio.sleep(0.1)
+        scan_config = scheduler.scheduled_scans[ScanType.PRIMARY]
+        assert scan_config.next_run > datetime.now(scheduler.cet)
+        assert [entry[0] for entry in scheduler._deadlines] == [scan_config.deadline]
+        
+        # The loop is in its error back-off sleep
+        scheduler._running = False
+        loop_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await loop_task
+        
+    @pytest.mark.asyncio
+    async def test_websocket_backoff_is_jittered(self):
+        """Test that failed reconnects back off exponentially with jitter."""
+        scheduler = Scheduler(EventBus())
+        scheduler._running = True
+        
+        attempts = 0
+        
+        async def failing_connect():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 4:
+                scheduler._running = False
+            raise ConnectionError("provider down")
+        
+        scheduler._websocket = Mock()
+        scheduler._websocket.connect = failing_connect
+        
+        with patch('src.orchestration.scheduler.random.uniform', return_value=0.0) as uniform:
+            await asyncio.wait_for(scheduler._manage_websocket(), timeout=1.0)
+        
+        assert [c.args for c in uniform.call_args_list] == [(0, 5), (0, 10), (0, 20), (0, 40)]
+        
+    @pytest.mark.asyncio
+    async def test_scheduler_state_round_trip(self, tmp_path):
+        """Test that schedule changes survive a restart."""
+        bus = EventBus()
+        state_file = str(tmp_path / "scheduler_state.json")
+        
+        scheduler = Scheduler(bus)
+        scheduler._state_file = state_file
+        await scheduler.schedule_scan("15:30", "primary")
+        scheduler.scheduled_scans[ScanType.SECOND_LOOK].enabled = False
+        await scheduler._save_state()
+        
+        restored = Scheduler(bus)
+        restored._state_file = state_file
+        await restored._load_state()
+        
+        primary = restored.scheduled_scans[ScanType.PRIMARY]
+        assert primary.scheduled_time.strftime("%H:%M") == "15:30"
+        assert restored.scheduled_scans[ScanType.SECOND_LOOK].enabled is False
 
 
 class TestCoordinator:
@@ -235,6 +590,14 @@ class TestCoordinator:
             
             await bus.subscribe(TradeSignal, signal_handler)
             
+            # Track score updates
+            update_batches = []
+            
+            async def update_handler(event: DataUpdateBatch):
+                update_batches.append(event)
+            
+            await bus.subscribe(DataUpdateBatch, update_handler)
+            
             # Run scan
             results = await coordinator.run_primary_scan()
             
@@ -247,6 +610,10 @@ class TestCoordinator:
             await asyncio.sleep(0.1)
             assert len(trade_signals) == 1
             
+            # Scores arrive as a single batch
+            assert len(update_batches) == 1
+            assert [u.symbol for u in update_batches[0].updates] == ["AAPL"]
+            
             await coordinator.stop()
         
         await bus.stop()
@@ -262,6 +629,25 @@ class TestCoordinator:
         assert "scan_active" in status
         assert "components" in status
         assert status["running"] is False
+        
+    @pytest.mark.asyncio
+    async def test_news_sentiment_cached(self):
+        """Test that sentiment is fetched once per symbol within the TTL."""
+        bus = EventBus()
+        news_manager = Mock()
+        news_manager.get_sentiment = AsyncMock(return_value={"sentiment_score": 0.5})
+        coordinator = Coordinator(bus, news_manager=news_manager)
+        
+        first = await coordinator._get_news_sentiment("AAPL")
+        second = await coordinator._get_news_sentiment("AAPL")
+        
+        assert first == second == {"sentiment_score": 0.5}
+        news_manager.get_sentiment.assert_awaited_once_with("AAPL")
+        
+        # Expired entries are fetched again
+        coordinator._sentiment_ttl = 0
+        await coordinator._get_news_sentiment("AAPL")
+        assert news_manager.get_sentiment.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -299,4 +685,16 @@ async def test_event_types():
     for event in events:
         assert event.event_type is not None
         assert event.timestamp is not None
-        assert event.priority is not None
\ No newline at end of file
+        assert event.priority is not None
+
+
+def test_event_timestamp_follows_wall_clock():
+    """Test that event timestamps track time.time(), not the monotonic stamp."""
+    # Simulate the wall/monotonic offset moving by an hour (suspend, NTP step)
+    shifted_ns = time.monotonic_ns() - 3600 * 10**9
+    before = time.time()
+    event = SystemStatus(component="test", status="running", timestamp_ns=shifted_ns)
+    after = time.time()
+    
+    assert event.timestamp_ns == shifted_ns
+    assert before - 1 <= event.timestamp.timestamp() <= after + 1
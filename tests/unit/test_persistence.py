@@ -2,10 +2,12 @@
 
 import pytest
 import sqlite3
+import numpy as np
 import tempfile
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import Mock
 
 from src.persistence.journal import TradeJournal
 from src.persistence.metrics import PerformanceMetrics
@@ -125,6 +127,27 @@ class TestTradeJournal:
         
         assert len(trades) == 1
         
+    def test_get_pnl_array(self, journal, sample_trade_plan):
+        """Test fetching closed-trade P&L as arrays."""
+        start = datetime.now() - timedelta(minutes=1)
+        for exit_price in (160.00, 145.00):
+            trade_id = journal.record_trade(sample_trade_plan, {})
+            journal.update_execution(trade_id, 150.00, datetime.now())
+            journal.close_trade(trade_id, exit_price, datetime.now())
+        journal.record_trade(sample_trade_plan, {})  # Still pending
+        
+        timestamps, pnl = journal.get_pnl_array(start, datetime.now())
+        
+        assert timestamps.dtype == np.dtype('datetime64[us]')
+        assert pnl.tolist() == [20.0, -10.0]
+        assert timestamps[0] <= timestamps[1]
+        
+        # An empty range yields empty arrays
+        timestamps, pnl = journal.get_pnl_array(
+            start - timedelta(days=2), start - timedelta(days=1)
+        )
+        assert timestamps.size == 0 and pnl.size == 0
+        
     def test_export_to_csv(self, journal, sample_trade_plan, tmp_path):
         """Test CSV export functionality."""
         # Record some trades
@@ -247,6 +270,33 @@ class TestPerformanceMetrics:
         assert overall['losing_trades'] == 1
         assert overall['total_pnl'] == 50.0
         assert overall['win_rate'] == pytest.approx(0.667, rel=0.01)
+        assert overall['profit_factor'] == pytest.approx(6.0)  # 60 / 10
+        
+    def test_overall_metrics_ignore_open_trades(self, metrics_with_trades):
+        """Test that open trades without P&L do not break the profit factor."""
+        metrics = metrics_with_trades
+        
+        plan = TradePlan(
+            symbol="NVDA",
+            score=70.0,
+            direction="long",
+            entry_strategy=EntryStrategy.MARKET,
+            entry_price=100.0,
+            stop_loss=97.0,
+            stop_loss_percent=3.0,
+            target_price=110.0,
+            target_percent=10.0,
+            exit_strategy=ExitStrategy.FIXED_TARGET,
+            position_size_eur=200.0,
+            position_size_shares=2,
+            max_risk_eur=6.0,
+            risk_reward_ratio=3.3
+        )
+        metrics.journal.record_trade(plan, {})
+        
+        overall = metrics.get_overall_metrics()
+        
+        assert overall['profit_factor'] == pytest.approx(6.0)
         
     def test_sharpe_ratio_calculation(self):
         """Test Sharpe ratio calculation."""
@@ -274,4 +324,70 @@ class TestPerformanceMetrics:
         max_dd = metrics._calculate_max_drawdown(trades)
         
         # From peak of 150 to low of -50 = 200/150 = 133%
-        assert max_dd == pytest.approx(133.33, rel=0.01)
\ No newline at end of file
+        assert max_dd == pytest.approx(133.33, rel=0.01)
+        
+    def test_summarize_pnl(self):
+        """Test vectorized win/loss aggregation."""
+        metrics = PerformanceMetrics()
+        
+        summary = metrics._summarize_pnl(np.array([20.0, -10.0, 40.0, 0.0, -5.0]))
+        
+        assert summary['total_trades'] == 5
+        assert summary['winning_trades'] == 2
+        assert summary['losing_trades'] == 2
+        assert summary['total_pnl'] == 45.0
+        assert summary['win_rate'] == pytest.approx(0.4)
+        assert summary['avg_win'] == 30.0
+        assert summary['avg_loss'] == -7.5
+        assert summary['largest_win'] == 40.0
+        assert summary['largest_loss'] == -10.0
+        
+        # No losing trades leaves the loss fields at zero
+        summary = metrics._summarize_pnl(np.array([5.0]))
+        assert summary['avg_loss'] == 0.0
+        assert summary['largest_loss'] == 0.0
+        
+    def test_daily_returns_single_query(self):
+        """Test that daily returns are bucketed from one range query."""
+        journal = Mock()
+        journal.get_pnl_array.return_value = (
+            np.array([
+                '2024-01-06 10:00:00',  # Saturday
+                '2024-01-08 10:00:00',
+                '2024-01-08 15:30:00.250000',
+                '2024-01-09 11:00:00',
+            ], dtype='datetime64[us]'),
+            np.array([99.0, 20.0, 30.0, -10.0])
+        )
+        metrics = PerformanceMetrics(journal=journal)
+        
+        returns = metrics._calculate_daily_returns(datetime(2024, 1, 5), datetime(2024, 1, 11))
+        
+        assert returns == [50.0 / 500.0, -10.0 / 500.0]
+        journal.get_pnl_array.assert_called_once()
+        
+    def test_store_metrics_bulk(self, temp_dbs):
+        """Test storing several daily rows in one call."""
+        journal_db, metrics_db = temp_dbs
+        metrics = PerformanceMetrics(TradeJournal(db_path=journal_db), db_path=metrics_db)
+        
+        rows = [
+            {
+                'date': (datetime(2024, 1, 8) + timedelta(days=i)).date(),
+                'total_trades': i + 1,
+                'winning_trades': i,
+                'losing_trades': 1,
+                'total_pnl': 10.0 * i,
+                'win_rate': i / (i + 1),
+                'avg_win': 5.0,
+                'avg_loss': -2.0,
+                'largest_win': 8.0,
+                'largest_loss': -3.0
+            }
+            for i in range(3)
+        ]
+        metrics.store_metrics_bulk('daily', rows)
+        
+        stored = metrics.get_metrics_by_period('daily')
+        assert [row['total_trades'] for row in stored] == [3, 2, 1]
+        assert stored[0]['date'] == '2024-01-10'
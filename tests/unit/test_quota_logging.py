@@ -4,11 +4,14 @@ import pytest
 import tempfile
 import os
 import csv
+import json
 import asyncio
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 
-from src.utils.quota import QuotaGuard, QuotaInfo, QuotaPeriod, rate_limit
+from src.utils.quota import QuotaExhausted, QuotaGuard, QuotaInfo, QuotaPeriod, rate_limit
 
 
 class TestQuotaLogging:
@@ -29,10 +32,12 @@ class TestQuotaLogging:
     def quota_guard(self, temp_files):
         """Create quota guard with temporary files."""
         state_path, log_path = temp_files
-        return QuotaGuard(
+        guard = QuotaGuard(
             quota_file=Path(state_path),
             usage_log_file=Path(log_path)
         )
+        yield guard
+        guard.close()
         
     @pytest.mark.asyncio
     async def test_usage_logging(self, quota_guard):
@@ -59,6 +64,24 @@ class TestQuotaLogging:
         assert logs[1]['endpoint'] == 'search_news'
         assert logs[1]['count'] == '2'
         
+    @pytest.mark.asyncio
+    async def test_usage_row_matches_csv_writer(self, quota_guard):
+        """Test that preformatted rows parse back like csv.writer output."""
+        endpoint = 'search "AAPL, MSFT"'
+        await quota_guard.consume_quota("newsapi", 3, endpoint)
+        
+        with open(quota_guard.usage_log_file, 'r', newline='') as f:
+            logs = list(csv.DictReader(f))
+            
+        assert len(logs) == 1
+        assert logs[0]['endpoint'] == endpoint
+        assert logs[0]['usage_before'] == '0'
+        assert logs[0]['usage_after'] == '3'
+        expected_percentage = round(quota_guard.quotas['newsapi'].usage_percentage, 2)
+        assert logs[0]['percentage'] == str(expected_percentage)
+        assert logs[0]['period'] == 'day'
+        assert logs[0]['error_message'] == ''
+        
     @pytest.mark.asyncio
     async def test_failed_quota_logging(self, quota_guard):
         """Test that failed quota attempts are logged."""
@@ -78,6 +101,163 @@ class TestQuotaLogging:
         assert logs[0]['success'] == 'False'
         assert logs[0]['error_message'] == 'Quota exhausted'
         
+    @pytest.mark.asyncio
+    async def test_state_save_is_debounced(self, quota_guard, monkeypatch):
+        """Test that consuming quota defers and coalesces state writes."""
+        import src.utils.quota
+        monkeypatch.setattr(src.utils.quota, 'QUOTA_SAVE_INTERVAL', 0.05)
+        
+        writes = []
+        original_write = quota_guard._write_state
+        monkeypatch.setattr(
+            quota_guard, '_write_state', lambda state: (writes.append(1), original_write(state))
+        )
+        
+        for _ in range(5):
+            await quota_guard.consume_quota("finnhub", 1, "get_quote")
+        assert writes == []
+        
+        await asyncio.sleep(0.1)
+        assert writes == [1]
+        
+        with open(quota_guard.quota_file, 'r') as f:
+            state = json.load(f)
+        assert state['finnhub']['used'] == 5
+        
+        # Nothing new to write
+        quota_guard.flush_state()
+        assert writes == [1]
+        
+    def test_state_file_is_compact_and_replaced_atomically(self, quota_guard):
+        """Test that the state file is written compactly with no temp file left."""
+        quota_guard.quotas['finnhub'].used = 7
+        quota_guard._save_state()
+        
+        raw = quota_guard.quota_file.read_text()
+        assert '\n' not in raw and ': ' not in raw
+        assert json.loads(raw)['finnhub']['used'] == 7
+        assert not Path(f"{quota_guard.quota_file}.tmp").exists()
+        
+    @pytest.mark.asyncio
+    async def test_disk_writes_run_off_the_event_loop(self, quota_guard, monkeypatch):
+        """Test that file writes run in worker threads, after counters update."""
+        writers = []
+        original_append = quota_guard._append_usage_rows
+        original_write = quota_guard._write_state
+        
+        def append(rows):
+            writers.append(threading.current_thread())
+            original_append(rows)
+        
+        def write(state):
+            writers.append(threading.current_thread())
+            original_write(state)
+        
+        monkeypatch.setattr(quota_guard, '_append_usage_rows', append)
+        monkeypatch.setattr(quota_guard, '_write_state', write)
+        
+        await quota_guard.consume_quota("finnhub", 1, "get_quote")
+        await quota_guard.reset_all()
+        
+        assert len(writers) == 2
+        assert threading.main_thread() not in writers
+        with open(quota_guard.quota_file, 'r') as f:
+            state = json.load(f)
+        assert state['finnhub']['used'] == 0
+        
+    @pytest.mark.asyncio
+    async def test_concurrent_usage_rows_are_batched(self, quota_guard, monkeypatch):
+        """Test that rows from concurrent consumers share writes."""
+        batches = []
+        original_append = quota_guard._append_usage_rows
+        monkeypatch.setattr(quota_guard, '_append_usage_rows',
+                            lambda rows: (batches.append(len(rows)), original_append(rows)))
+        
+        await asyncio.gather(
+            *(quota_guard.consume_quota("newsapi", 1, f"search_{i}") for i in range(20))
+        )
+        
+        assert sum(batches) == 20
+        assert len(batches) < 20
+        with open(quota_guard.usage_log_file, 'r') as f:
+            logs = list(csv.DictReader(f))
+        assert sorted(log['endpoint'] for log in logs) == sorted(f"search_{i}" for i in range(20))
+        
+    @pytest.mark.asyncio
+    async def test_concurrent_consumers_never_overdraw(self, quota_guard):
+        """Test that concurrent consumers cannot exceed the limit without a lock."""
+        quota_guard.quotas['finnhub'].used = 55
+        
+        results = await asyncio.gather(
+            *(quota_guard.consume_quota("finnhub", 1, "get_quote") for _ in range(10)),
+            return_exceptions=True
+        )
+        
+        assert sum(isinstance(r, QuotaExhausted) for r in results) == 5
+        assert quota_guard.quotas['finnhub'].used == 60
+        
+    def test_state_round_trip(self, temp_files):
+        """Test that saved usage is restored by a new guard."""
+        state_path, log_path = temp_files
+        guard = QuotaGuard(quota_file=Path(state_path), usage_log_file=Path(log_path))
+        guard.quotas['newsapi'].used = 12
+        guard._save_state()
+        
+        reloaded = QuotaGuard(quota_file=Path(state_path), usage_log_file=Path(log_path))
+        assert reloaded.quotas['newsapi'].used == 12
+        assert reloaded.quotas['newsapi'].last_reset == guard.quotas['newsapi'].last_reset
+        
+    def test_should_reset_per_period(self):
+        """Test that each period resets after its own length."""
+        now = time.time()
+        for period, seconds in [(QuotaPeriod.MINUTE, 60), (QuotaPeriod.HOUR, 3600),
+                                (QuotaPeriod.DAY, 86400), (QuotaPeriod.MONTH, 2592000)]:
+            quota = QuotaInfo(provider="test", limit=10, period=period)
+            quota.restore(used=0, last_reset=now - seconds + 30, last_call=now)
+            assert not quota.should_reset
+            quota.restore(used=0, last_reset=now - seconds, last_call=now)
+            assert quota.should_reset
+        
+    def test_should_reset_ignores_wall_clock_steps(self, monkeypatch):
+        """Test that a wall-clock jump does not force or skip a reset."""
+        quota = QuotaInfo(provider="test", limit=10, period=QuotaPeriod.MINUTE)
+        wall = time.time()
+        monkeypatch.setattr(time, 'time', lambda: wall + 3600)
+        assert not quota.should_reset
+        
+        monotonic = time.monotonic()
+        monkeypatch.setattr(time, 'time', lambda: wall - 3600)
+        monkeypatch.setattr(time, 'monotonic', lambda: monotonic + 61)
+        assert quota.should_reset
+        
+    def test_quota_info_uses_slots(self):
+        """Test that QuotaInfo instances carry no per-instance __dict__."""
+        quota = QuotaInfo(provider="test", limit=10, period=QuotaPeriod.MINUTE)
+        assert not hasattr(quota, '__dict__')
+        with pytest.raises(AttributeError):
+            quota.unknown = 1
+        
+    def test_get_status_has_no_side_effects(self, quota_guard):
+        """Test that get_status reports an expired window without resetting it."""
+        quota = quota_guard.quotas['finnhub']
+        quota.restore(used=30, last_reset=time.time() - 120, last_call=time.time())
+        
+        status = quota_guard.get_status()['finnhub']
+        assert status['used'] == 0
+        assert status['remaining'] == quota.limit
+        assert status['last_call'] == datetime.fromtimestamp(quota.last_call).isoformat()
+        assert quota.used == 30
+        assert not quota_guard._dirty
+        
+    @pytest.mark.asyncio
+    async def test_check_quotas_for_several_providers(self, quota_guard):
+        """Test that check_quotas needs every provider to have room."""
+        assert await quota_guard.check_quotas({"finnhub": 10, "newsapi": 5})
+        
+        quota_guard.quotas['newsapi'].used = quota_guard.quotas['newsapi'].limit
+        assert not await quota_guard.check_quotas({"finnhub": 10, "newsapi": 1})
+        assert await quota_guard.check_quotas({"finnhub": 10, "unknown": 1})
+        
     def test_usage_summary(self, quota_guard):
         """Test usage summary calculation."""
         # Add some test data to the log
@@ -107,6 +287,38 @@ class TestQuotaLogging:
         assert summary['by_provider']['finnhub']['total_calls'] == 10
         assert summary['by_provider']['newsapi']['total_calls'] == 5
         
+    def test_usage_summary_reads_only_new_rows(self, quota_guard, monkeypatch):
+        """Test that repeated summaries fold in appended rows incrementally."""
+        now = datetime.now()
+        with open(quota_guard.usage_log_file, 'a', newline='') as f:
+            csv.writer(f).writerow([
+                now.isoformat(), 'finnhub', 'quote', 4,
+                0, 4, 60, 6.67, 'minute', True, ''
+            ])
+        assert quota_guard.get_usage_summary(days=1)['total_calls'] == 4
+        
+        folded = []
+        original_fold = quota_guard._fold_usage_row
+        monkeypatch.setattr(quota_guard, '_fold_usage_row',
+                            lambda row: (folded.append(row), original_fold(row)))
+        
+        with open(quota_guard.usage_log_file, 'a', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                now.isoformat(), 'newsapi', 'search', 3,
+                0, 3, 1000, 0.3, 'day', True, ''
+            ])
+            # Just outside a one-hour window
+            writer.writerow([
+                (now - timedelta(hours=1, minutes=2)).isoformat(), 'finnhub', 'quote', 9,
+                4, 13, 60, 21.67, 'minute', True, ''
+            ])
+            
+        summary = quota_guard.get_usage_summary(days=1)
+        assert len(folded) == 2
+        assert summary['total_calls'] == 16
+        assert quota_guard.get_usage_summary(days=1 / 24)['total_calls'] == 7
+        
     def test_daily_export(self, quota_guard, tmp_path):
         """Test daily summary export."""
         # Add test data
@@ -167,6 +379,31 @@ class TestQuotaLogging:
         assert logs[0]['endpoint'] == 'test_function'
         assert logs[0]['count'] == '3'
         
+    def test_rate_limit_sync_decorator(self, quota_guard, monkeypatch):
+        """Test that the sync wrapper consumes quota without an event loop."""
+        import src.utils.quota
+        monkeypatch.setattr(src.utils.quota, '_quota_guard', quota_guard)
+        
+        @rate_limit("finnhub", count=2, endpoint="sync_call")
+        def sync_api_call():
+            return "success"
+            
+        assert sync_api_call() == "success"
+        assert quota_guard.quotas['finnhub'].used == 2
+        
+        # No loop to defer to, so the first change is written inline
+        with open(quota_guard.quota_file, 'r') as f:
+            state = json.load(f)
+        assert state['finnhub']['used'] == 2
+        
+        quota_guard.quotas['finnhub'].used = 60
+        with pytest.raises(QuotaExhausted):
+            sync_api_call()
+        
+        with open(quota_guard.usage_log_file, 'r') as f:
+            logs = list(csv.DictReader(f))
+        assert [log['success'] for log in logs] == ['True', 'False']
+        
     def test_quota_with_endpoint_tracking(self, quota_guard):
         """Test that different endpoints are tracked separately."""
         # Run multiple calls with different endpoints